@@ -0,0 +1,194 @@
+"""
+Bullet System for Linha Direta: The Game
+Stores every projectile in flat typed arrays (structure of arrays) and advances,
+culls and tile-tests them in one tight loop per frame, with swap-remove compaction
+"""
+
+import pygame
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
+from src.core.constants import Bullet as BulletConst, Physics
+from src.core.mathUtils import traverse_grid, summed_area_sum
+
+
+class BulletSystem:
+    """All live projectiles of the current room, player and enemy alike"""
+
+    OWNER_PLAYER = 0
+    OWNER_ENEMY = 1
+
+    def __init__(self) -> None:
+        self.x = array("d")
+        self.y = array("d")
+        self.vx = array("d")
+        self.vy = array("d")
+        self.lifetime = array("d")
+        self.damage = array("i")
+        self.owner = array("b")
+        self.size = array("i")
+        self.penetration = array("b")
+        # Inimigos já atingidos por cada projétil perfurante (None para os demais)
+        self.hit_ids: List[Optional[Set[int]]] = []
+
+        self._fields = (self.x, self.y, self.vx, self.vy, self.lifetime,
+                        self.damage, self.owner, self.size, self.penetration, self.hit_ids)
+
+        # Sprites pré-renderizados por (dono, tamanho)
+        self._sprites: Dict[Tuple[int, int], pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @property
+    def count(self) -> int:
+        return len(self.x)
+
+    def count_owned_by(self, owner: int) -> int:
+        return self.owner.count(owner)
+
+    def spawn(self, x: float, y: float, vx: float, vy: float, damage: int, owner: int,
+              lifetime: float = BulletConst.DEFAULT_LIFETIME,
+              size: int = BulletConst.DEFAULT_SIZE[0], penetration: bool = False) -> int:
+        """Adiciona um projétil e retorna seu índice atual (muda após remoções)"""
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.lifetime.append(lifetime)
+        self.damage.append(int(damage))
+        self.owner.append(owner)
+        self.size.append(int(size))
+        self.penetration.append(1 if penetration else 0)
+        self.hit_ids.append(set() if penetration else None)
+        return len(self.x) - 1
+
+    def spawn_bullet(self, bullet) -> int:
+        """Adapter for the Bullet objects returned by Entity.shoot() / Enemy.update()"""
+        owner = self.OWNER_PLAYER if bullet.is_player_bullet else self.OWNER_ENEMY
+        return self.spawn(bullet.position.x, bullet.position.y,
+                          bullet.directedSpeed.x, bullet.directedSpeed.y,
+                          bullet.damage, owner, size=bullet.size[0],
+                          penetration=getattr(bullet, "penetration", False))
+
+    def remove(self, index: int) -> None:
+        """Swap-remove: o último projétil ocupa o lugar do removido (O(1))"""
+        last = len(self.x) - 1
+        if index != last:
+            for field in self._fields:
+                field[index] = field[last]
+        for field in self._fields:
+            field.pop()
+
+    def clear(self) -> None:
+        for field in self._fields:
+            del field[:]
+
+    def update(self, delta_time: float, world_width: float, world_height: float, room=None) -> None:
+        """Move, expira, remove fora dos limites e testa tiles sólidos em um único laço.
+        O teste de tiles varre o caminho percorrido no frame, então nenhum projétil
+        atravessa paredes finas, seja qual for o delta_time"""
+        xs, ys, vxs, vys = self.x, self.y, self.vx, self.vy
+        lifetimes, owners, sizes = self.lifetime, self.owner, self.size
+        remove = self.remove
+
+        matrix = room.collision_matrix if room is not None else None
+        table = room.collision_sat if room is not None else None
+        rows = len(matrix) if matrix else 0
+        cols = len(matrix[0]) if rows else 0
+        tile_width, tile_height = room.tile_size if room is not None else Physics.DEFAULT_TILE_SIZE
+
+        padding = Physics.COLLISION_PADDING
+        player_probe_w = BulletConst.COLLISION_CHECK_SIZE[0] * padding
+        player_probe_h = BulletConst.COLLISION_CHECK_SIZE[1] * padding
+        player_owner = self.OWNER_PLAYER
+
+        # De trás para frente: o swap-remove só traz projéteis já processados
+        for i in range(len(xs) - 1, -1, -1):
+            previous_x = xs[i]
+            previous_y = ys[i]
+            x = previous_x + vxs[i] * delta_time
+            y = previous_y + vys[i] * delta_time
+            xs[i] = x
+            ys[i] = y
+
+            lifetime = lifetimes[i] - delta_time
+            lifetimes[i] = lifetime
+
+            if lifetime <= 0 or x < 0 or x > world_width or y < 0 or y > world_height:
+                remove(i)
+                continue
+
+            if not rows:
+                continue
+
+            # Varredura contínua do caminho (DDA) - pega paredes puladas entre dois frames
+            impact = traverse_grid((previous_x, previous_y), (x, y), matrix, tile_width, tile_height)
+            if impact is not None:
+                remove(i)
+                continue
+
+            # Mesmo teste de Room.check_collision na posição final, com a posição como topo-esquerdo
+            if owners[i] == player_owner:
+                probe_w, probe_h = player_probe_w, player_probe_h
+            else:
+                probe_w = probe_h = sizes[i] * padding
+
+            tile_left = max(0, int(x // tile_width))
+            tile_right = min(cols - 1, int((x + probe_w) // tile_width))
+            tile_top = max(0, int(y // tile_height))
+            tile_bottom = min(rows - 1, int((y + probe_h) // tile_height))
+
+            if summed_area_sum(table, tile_left, tile_top, tile_right, tile_bottom):
+                remove(i)
+
+    def get_rect(self, index: int) -> pygame.Rect:
+        size = self.size[index]
+        return pygame.Rect(self.x[index], self.y[index], size, size)
+
+    def _get_sprite(self, owner: int, size: int) -> pygame.Surface:
+        key = (owner, size)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._create_sprite(owner, size)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _create_sprite(self, owner: int, size: int) -> pygame.Surface:
+        """Mesmo desenho do antigo Bullet.draw(), feito uma vez só"""
+        color = BulletConst.COLOR if owner == self.OWNER_PLAYER else BulletConst.ENEMY_COLOR
+        radius = size // 2
+        center = radius + 2
+
+        sprite = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (0, 0, 0), (center, center), radius + 1)
+        pygame.draw.circle(sprite, color, (center, center), radius)
+        pygame.draw.circle(sprite, (255, 255, 255), (center, center), max(1, radius // 3))
+        return sprite
+
+    def draw(self, screen, camera_offset: Tuple[float, float]) -> None:
+        """Desenha os projéteis visíveis centrados na posição (screen pode ser uma RenderList)"""
+        offset_x, offset_y = camera_offset
+        screen_width, screen_height = screen.get_size()
+        xs, ys, owners, sizes = self.x, self.y, self.owner, self.size
+        get_sprite = self._get_sprite
+        blit = screen.blit
+
+        for i in range(len(xs)):
+            size = sizes[i]
+            screen_x = int(xs[i] - offset_x)
+            screen_y = int(ys[i] - offset_y)
+            if (screen_x + size < 0 or screen_y + size < 0 or
+                    screen_x - size > screen_width or screen_y - size > screen_height):
+                continue
+
+            sprite = get_sprite(owners[i], size)
+            half = sprite.get_width() // 2
+            blit(sprite, (screen_x - half, screen_y - half))
+
+    def draw_debug(self, screen: pygame.Surface, camera_offset: Tuple[float, float],
+                   player_color: Tuple[int, int, int], enemy_color: Tuple[int, int, int]) -> None:
+        offset_x, offset_y = camera_offset
+        for i in range(len(self.x)):
+            color = player_color if self.owner[i] == self.OWNER_PLAYER else enemy_color
+            size = self.size[i]
+            pygame.draw.rect(screen, color, (self.x[i] - offset_x, self.y[i] - offset_y, size, size), 2)
@@ -62,9 +62,9 @@ class Camera:
         return pygame.Rect(self.x, self.y, self.width, self.height)
     
     def is_visible(self, obj_pos: Tuple[float, float], obj_size: Tuple[int, int]) -> bool:
-        obj_rect = pygame.Rect(obj_pos[0], obj_pos[1], obj_size[0], obj_size[1])
-        view_rect = self.get_view_rect()
-        return view_rect.colliderect(obj_rect)
+        """Interseção do retângulo (topo-esquerdo, tamanho) com a view - sem alocar Rects"""
+        return (obj_pos[0] < self.x + self.width and obj_pos[0] + obj_size[0] > self.x and
+                obj_pos[1] < self.y + self.height and obj_pos[1] + obj_size[1] > self.y)
     
     def set_position(self, x: float, y: float) -> None:
         self.x = x
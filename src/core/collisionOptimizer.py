@@ -16,6 +16,8 @@ class CollisionObject:
     id: str
     is_static: bool = False  # Static objects don't move (walls, tiles)
     last_position: Tuple[float, float] = (0, 0)
+    kind: str = ""  # Tag for filtering queries ("enemy", "player", ...)
+    order: int = 0  # Insertion counter - stable ordering for query results (ids hash differently per run)
 
 class SpatialGrid:
     """Simple spatial partitioning system using a grid"""
@@ -33,6 +35,7 @@ class SpatialGrid:
         
         # Cache for frequently accessed cells
         self.cell_cache: Dict[Tuple[int, int], Set[str]] = {}
+        self._next_order = 0
         
     def _get_cell_coords(self, x: float, y: float) -> Tuple[int, int]:
         """Get grid cell coordinates for a world position"""
@@ -56,9 +59,12 @@ class SpatialGrid:
         
         return cells
     
-    def add_object(self, obj_id: str, obj: Any, rect: pygame.Rect, is_static: bool = False):
-        """Add an object to the spatial grid"""
-        collision_obj = CollisionObject(obj, rect, obj_id, is_static, (rect.centerx, rect.centery))
+    def add_object(self, obj_id: str, obj: Any, rect: pygame.Rect, is_static: bool = False, kind: str = ""):
+        """Add an object to the spatial grid (the grid keeps its own copy of rect)"""
+        rect = rect.copy()
+        collision_obj = CollisionObject(obj, rect, obj_id, is_static, (rect.centerx, rect.centery), kind,
+                                        self._next_order)
+        self._next_order += 1
         self.objects[obj_id] = collision_obj
         
         # Add to appropriate cells
@@ -74,20 +80,21 @@ class SpatialGrid:
         collision_obj = self.objects[obj_id]
         old_rect = collision_obj.rect
         
-        # Only update if position actually changed
-        if old_rect.center != new_rect.center:
-            # Remove from old cells
+        # Only update if the rect actually changed
+        if old_rect != new_rect:
             old_cells = self._get_cells_for_rect(old_rect)
-            for row, col in old_cells:
-                self.grid[row][col].discard(obj_id)
-            
-            # Add to new cells
             new_cells = self._get_cells_for_rect(new_rect)
-            for row, col in new_cells:
-                self.grid[row][col].add(obj_id)
+            
+            # Cells only change when the rect crosses a cell border
+            if old_cells != new_cells:
+                for row, col in old_cells:
+                    self.grid[row][col].discard(obj_id)
+                
+                for row, col in new_cells:
+                    self.grid[row][col].add(obj_id)
             
             # Update object data
-            collision_obj.rect = new_rect
+            old_rect.update(new_rect)
             collision_obj.last_position = new_rect.center
     
     def remove_object(self, obj_id: str):
@@ -133,9 +140,12 @@ class CollisionOptimizer:
         """Add a static object (walls, obstacles that don't move)"""
         self.spatial_grid.add_object(obj_id, obj, rect, is_static=True)
     
-    def add_dynamic_object(self, obj_id: str, obj: Any, rect: pygame.Rect):
+    def add_dynamic_object(self, obj_id: str, obj: Any, rect: pygame.Rect, kind: str = ""):
         """Add a dynamic object (player, enemies, bullets)"""
-        self.spatial_grid.add_object(obj_id, obj, rect, is_static=False)
+        self.spatial_grid.add_object(obj_id, obj, rect, is_static=False, kind=kind)
+    
+    def has_object(self, obj_id: str) -> bool:
+        return obj_id in self.spatial_grid.objects
     
     def update_object(self, obj_id: str, new_rect: pygame.Rect):
         """Update a dynamic object's position"""
@@ -188,6 +198,21 @@ class CollisionOptimizer:
         
         return colliding
     
+    def get_nearby_dynamic_objects(self, rect: pygame.Rect, kind: str) -> List[CollisionObject]:
+        """Broad phase for hits: dynamic objects of a kind in the cells overlapped by rect"""
+        return [collision_obj for collision_obj in self.spatial_grid.get_nearby_objects(rect)
+                if collision_obj.kind == kind]
+    
+    def get_dynamic_objects_in_rect(self, rect: pygame.Rect) -> List[CollisionObject]:
+        """Broad phase for rendering: every dynamic object in the cells overlapped by rect"""
+        return [collision_obj for collision_obj in self.spatial_grid.get_nearby_objects(rect)
+                if not collision_obj.is_static]
+    
+    def get_nearby_static_rects(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Broad phase for movement: rects of static objects in the cells overlapped by rect"""
+        return [collision_obj.rect for collision_obj in self.spatial_grid.get_nearby_objects(rect)
+                if collision_obj.is_static]
+    
     def update_frame(self):
         """Call this once per frame to manage cache"""
         self.cache_frame += 1
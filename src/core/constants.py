@@ -31,9 +31,14 @@ class Enemy:
     ATTACK_RANGE = 120.0
     ATTACK_INTERVAL_SECONDS = 1.2
     DETECTION_RANGE = 250.0
+    SLEEP_RANGE_FACTOR = 1.25  # Histerese: só volta a dormir além de detection_range * fator
     DEFAULT_DAMAGE = 15  # Default damage when no weapon is equipped
     BULLET_SPAWN_OFFSET = 20  # Distance from enemy center to spawn bullet
     
+    # Behaviors (entities.json) que perseguem o player pelo flow field
+    DEFAULT_BEHAVIOR = "idle"
+    CHASE_BEHAVIORS = ("chase", "patrol_and_chase")
+    
     # Enemy Types
     BASIC_ENEMY_HEALTH = 50
     BASIC_ENEMY_SPEED = 80
@@ -53,8 +58,11 @@ class Bullet:
     ENEMY_BULLET_SIZE = (8, 8)
     ENEMY_BULLET_SPEED = 400
     
+    DEFAULT_LIFETIME = 5.0  # Segundos até o projétil expirar (cobre a maior sala)
+    
     # Visual
     COLOR = (255, 215, 0)  # Dourado para as balas
+    ENEMY_COLOR = (255, 100, 100)  # Vermelho claro para balas dos inimigos
 
 # ==============================================
 # ITEM & DROP SETTINGS
@@ -91,6 +99,11 @@ class Rendering:
     DEFAULT_WINDOW_WIDTH = 800
     DEFAULT_WINDOW_HEIGHT = 600
     TARGET_FPS = 60
+    CULL_MARGIN = 32  # Sprites podem passar da hitbox registrada no grid (rotação)
+    BACKGROUND_CHUNK_SIZE = 256  # Lado (px) dos pedaços do background da sala
+    ROTATION_BUCKETS = 64  # Ângulos distintos por sprite no cache de rotação (5.6° cada)
+    MAX_DIRTY_RECTS = 64  # Acima disso o frame vai com um flip completo
+    MAX_DIRTY_AREA_RATIO = 0.5  # Idem se os rects sujos cobrem mais que isso da tela
     
     # Font sizes
     PAUSE_FONT_SIZE = 64
@@ -104,6 +117,13 @@ class Rendering:
     HEALTH_POS = (10, 10)
     AMMO_POS = (10, 50)
     TIMER_POS = (10, 90)
+    FPS_MARGIN = 10  # Distância do FPS ao canto superior direito
+    
+    # HUD text
+    HUD_FONT_SIZE = 36
+    DEBUG_FONT_SIZE = 24
+    HUD_TEXT_COLOR = (255, 255, 255)
+    HUD_GLYPHS = " 0123456789:"  # Caracteres do atlas do timer
     
     # Background colors
     DEFAULT_ROOM_COLOR = (64, 64, 64)
@@ -137,6 +157,46 @@ class FireDamage:
     DAMAGE_INTERVAL = 1.0  # Seconds between damage ticks
     FIRE_WARNING_COLOR = (255, 100, 0)  # Orange overlay for fire zones
 
+# ==============================================
+# CACHES
+# ==============================================
+class Cache:
+    IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Orçamento do cache de imagens (None = sem limite)
+    TEXT_CACHE_MAX_ENTRIES = 256  # Textos renderizados guardados pelo FontManager (LRU)
+    
+    # Cache compilado dos mapas (TMX/TSX já parseados)
+    MAP_CACHE_DIR = ".cache/maps"
+    MAP_CACHE_FORMAT_VERSION = 1  # Incrementar quando o formato do payload mudar
+
+# ==============================================
+# HEADLESS SIMULATION
+# ==============================================
+class Simulation:
+    FIXED_DELTA_TIME = 1.0 / 60.0  # Passo fixo usado no modo headless
+    DEFAULT_FRAMES = 600
+    DEFAULT_SEED = 1234
+    
+    # Script de input padrão
+    DIRECTION_HOLD_FRAMES = 60  # Quantos frames segurar cada direção
+    CLICK_INTERVAL_FRAMES = 15  # Um tiro a cada N frames
+    MOUSE_ORBIT_RADIUS = 150
+
+# ==============================================
+# LEVEL OF DETAIL (atualização de entidades fora da tela)
+# ==============================================
+class LevelOfDetail:
+    NEAR_MARGIN = 256  # Pixels além da tela que ainda contam como "perto"
+    NEAR_UPDATE_INTERVAL = 3  # Perto da tela: atualiza a cada N frames
+    FAR_UPDATE_INTERVAL = 10  # Longe: só a lógica (movimento, cooldown, tiro), sem animação
+
+# ==============================================
+# FRAME PROFILING
+# ==============================================
+class Profiling:
+    WINDOW_FRAMES = 120  # Janela da média móvel (~2s a 60 FPS)
+    FRAME_BUDGET_MS = 1000.0 / 60.0
+    OVER_BUDGET_COLOR = (255, 120, 120)
+
 # ==============================================
 # FILE PATHS (removing hardcoded paths)
 # ==============================================
@@ -150,6 +210,9 @@ class Assets:
     # Audio
     PISTOL_SOUND = "assets/audio/sfx/pistol_sound.wav"
     FOOTSTEP_SOUND = "assets/audio/sfx/footstep.mp3"
+    
+    # Fonts
+    FONT_TECHNO = "assets/fonts/techno_hideo.ttf"
 
 # ==============================================
 # HELPER FUNCTIONS (para conversões comuns)
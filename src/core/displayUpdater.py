@@ -0,0 +1,86 @@
+"""
+Display Updater for Linha Direta: The Game
+Presents a frame with pygame.display.update(rects) over only the areas that
+changed, falling back to a full flip when the view scrolls or too much changed,
+and skipping the present entirely when nothing did
+"""
+
+import pygame
+from typing import Dict, Hashable, Iterable, List, Optional
+from src.core.constants import Rendering
+
+
+class DisplayUpdater:
+    """Junta os rects sujos do frame e decide entre flip, update(rects) ou nada.
+    Os rects de um frame também são enviados no seguinte - apagam o que saiu do lugar"""
+
+    def __init__(self, screen_size, max_rects: int = Rendering.MAX_DIRTY_RECTS,
+                 max_area_ratio: float = Rendering.MAX_DIRTY_AREA_RATIO) -> None:
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.max_rects = max_rects
+        self.max_area = self.screen_rect.width * self.screen_rect.height * max_area_ratio
+
+        self._dirty: List[pygame.Rect] = []
+        self._previous: List[pygame.Rect] = []
+        self._full_update = True  # O primeiro frame sempre vai inteiro
+        self._view_key: Optional[Hashable] = None
+
+        # Performance counters
+        self.flips = 0
+        self.partial_updates = 0
+        self.skipped = 0
+
+    @property
+    def needs_redraw(self) -> bool:
+        """False quando a tela não mudou desde o último present"""
+        return self._full_update or bool(self._dirty)
+
+    def request_full_update(self) -> None:
+        self._full_update = True
+
+    def set_view(self, view_key: Hashable) -> None:
+        """Câmera/sala do frame - se mudou, a tela inteira mudou"""
+        if view_key != self._view_key:
+            self._view_key = view_key
+            self._full_update = True
+
+    def mark_dirty(self, rect: pygame.Rect) -> None:
+        self._dirty.append(rect)
+
+    def mark_dirty_rects(self, rects: Iterable[pygame.Rect]) -> None:
+        self._dirty.extend(rects)
+
+    def present(self) -> None:
+        """Envia o frame para a janela do jeito mais barato possível"""
+        if self._full_update:
+            self._flip()
+            return
+
+        if not self._dirty and not self._previous:
+            self.skipped += 1
+            return
+
+        screen_rect = self.screen_rect
+        rects = [rect.clip(screen_rect) for rect in self._previous + self._dirty]
+        rects = [rect for rect in rects if rect.width and rect.height]
+
+        # Muitos pedaços (ou quase a tela toda) - um flip sai mais barato
+        if len(rects) > self.max_rects or sum(rect.width * rect.height for rect in rects) > self.max_area:
+            self._flip()
+            return
+
+        if rects:
+            pygame.display.update(rects)
+        self.partial_updates += 1
+        self._previous = self._dirty
+        self._dirty = []
+
+    def _flip(self) -> None:
+        pygame.display.flip()
+        self.flips += 1
+        self._full_update = False
+        self._previous = self._dirty
+        self._dirty = []
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"flips": self.flips, "partial_updates": self.partial_updates, "skipped": self.skipped}
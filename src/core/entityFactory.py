@@ -140,7 +140,8 @@ class EntityFactory:
                 sprite_config=sprite_config,  
                 detection_range=config.get("detection_range", EnemyConst.DETECTION_RANGE),
                 drops=config.get("drops", []),
-                hitbox_size=tuple(config.get("hitbox_size", config.get("size", EnemyConst.BASIC_ENEMY_SIZE)))
+                hitbox_size=tuple(config.get("hitbox_size", config.get("size", EnemyConst.BASIC_ENEMY_SIZE))),
+                behavior=config.get("behavior", EnemyConst.DEFAULT_BEHAVIOR)
             )
             
             return enemy
@@ -215,9 +216,11 @@ class EntityFactory:
             return None
         
         weapon_config = self.configs["weapons"][weapon_name]
-        return Weapon(
+        weapon = Weapon(
             id=weapon_name.lower(),
             name=weapon_config.get("name", weapon_name),
             damage=weapon_config.get("damage", 10),
             max_ammo=weapon_config.get("max_ammo", 100)
-        )
\ No newline at end of file
+        )
+        weapon.bullet_config = weapon_config.get("bullet", {})
+        return weapon
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Flow Field for Linha Direta: The Game
+Shared pathfinding toward the player: one BFS from the player's tile over the
+room's collision matrix, and every chasing enemy reads its next step in O(1)
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+
+
+class FlowField:
+    """Cada célula livre aponta para a vizinha um passo mais perto do alvo.
+    Só é recalculado quando o alvo troca de tile"""
+
+    # Ortogonais primeiro - em empates o caminho prefere passos retos
+    NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+    UNREACHABLE = -1
+
+    def __init__(self, collision_matrix: List[List[bool]], tile_size: Tuple[int, int]) -> None:
+        self.matrix = collision_matrix
+        self.tile_width, self.tile_height = tile_size
+        self.rows = len(collision_matrix) if collision_matrix else 0
+        self.cols = len(collision_matrix[0]) if self.rows else 0
+
+        # Índice (y * cols + x) da próxima célula do caminho; o alvo aponta para si mesmo
+        self.next_cell = array("i", [self.UNREACHABLE]) * (self.rows * self.cols)
+        self.target_tile: Optional[Tuple[int, int]] = None
+
+        # Performance counters
+        self.rebuilds = 0
+
+    def get_tile(self, position) -> Tuple[int, int]:
+        return int(position[0] // self.tile_width), int(position[1] // self.tile_height)
+
+    def update(self, target_position) -> bool:
+        """Recalcula o campo se o alvo mudou de tile; retorna True se recalculou"""
+        tile = self.get_tile(target_position)
+        if tile == self.target_tile:
+            return False
+
+        self.target_tile = tile
+        self._rebuild(tile)
+        self.rebuilds += 1
+        return True
+
+    def _rebuild(self, tile: Tuple[int, int]) -> None:
+        """BFS de 8 vizinhos a partir do alvo, sem cortar quinas de parede"""
+        matrix, rows, cols = self.matrix, self.rows, self.cols
+        unreachable = self.UNREACHABLE
+        next_cell = array("i", [unreachable]) * (rows * cols)
+        self.next_cell = next_cell
+
+        target_x, target_y = tile
+        if not (0 <= target_x < cols and 0 <= target_y < rows):
+            return
+
+        start = target_y * cols + target_x
+        next_cell[start] = start
+        queue = [start]
+        head = 0
+
+        while head < len(queue):
+            index = queue[head]
+            head += 1
+            y, x = divmod(index, cols)
+
+            for dx, dy in self.NEIGHBORS:
+                nx = x + dx
+                ny = y + dy
+                if nx < 0 or ny < 0 or nx >= cols or ny >= rows:
+                    continue
+
+                neighbor = ny * cols + nx
+                if next_cell[neighbor] != unreachable or matrix[ny][nx]:
+                    continue
+
+                # Diagonal só com as duas ortogonais livres (a hitbox não raspa a quina)
+                if dx and dy and (matrix[y][nx] or matrix[ny][x]):
+                    continue
+
+                next_cell[neighbor] = index
+                queue.append(neighbor)
+
+    def get_waypoint(self, position, target_position) -> Optional[Tuple[float, float]]:
+        """Próximo ponto para onde andar: o centro da próxima célula, o próprio alvo
+        quando já está no tile dele, ou None se o alvo é inalcançável daqui"""
+        x, y = self.get_tile(position)
+        if not (0 <= x < self.cols and 0 <= y < self.rows):
+            return None
+
+        index = y * self.cols + x
+        step = self.next_cell[index]
+        if step == self.UNREACHABLE:
+            return None
+        if step == index:
+            return (target_position[0], target_position[1])
+
+        step_y, step_x = divmod(step, self.cols)
+        return ((step_x + 0.5) * self.tile_width, (step_y + 0.5) * self.tile_height)
@@ -0,0 +1,84 @@
+"""
+Font Manager for Linha Direta: The Game
+Process-wide font registry (each (file, size) loaded once) plus an LRU cache of
+rendered text surfaces keyed by (font, text, colour, antialias)
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from src.core.constants import Cache
+
+FontKey = Tuple[Optional[str], int]
+TextKey = Tuple[pygame.font.Font, str, tuple, bool]
+
+
+class FontManager:
+    """Fontes compartilhadas por todas as telas e textos já renderizados.
+    As superfícies do cache são compartilhadas - nunca desenhe nelas"""
+
+    def __init__(self, max_texts: int = Cache.TEXT_CACHE_MAX_ENTRIES) -> None:
+        self.max_texts = max_texts
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self._texts: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+
+        # Performance counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_font(self, path: Optional[str], size: int) -> pygame.font.Font:
+        """Fonte do arquivo (None = fonte padrão do pygame); cai na padrão se o arquivo não carregar"""
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        if path is None:
+            font = pygame.font.Font(None, size)
+        else:
+            try:
+                font = pygame.font.Font(path, size)
+            except (OSError, pygame.error, RuntimeError) as e:
+                print(f"Erro ao carregar fonte {path}: {e}")
+                font = self.get_font(None, size)
+
+        self._fonts[key] = font
+        return font
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """Mesmo resultado de font.render(text, antialias, color), reaproveitado entre frames"""
+        key = (font, text, tuple(color), antialias)
+        surface = self._texts.get(key)
+        if surface is not None:
+            self._texts.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._texts[key] = surface
+        if len(self._texts) > self.max_texts:
+            self._texts.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self._texts.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "fonts": len(self._fonts),
+            "texts": len(self._texts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+_font_manager_instance: Optional[FontManager] = None
+
+def get_font_manager() -> FontManager:
+    global _font_manager_instance
+    if _font_manager_instance is None:
+        _font_manager_instance = FontManager()
+    return _font_manager_instance
@@ -0,0 +1,94 @@
+"""
+Frame Profiler for Linha Direta: The Game
+Records wall time per frame stage and keeps rolling averages / worst cases
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from src.core.constants import Profiling
+
+
+class _StageTimer:
+    """Context manager reutilizável que mede um estágio"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: 'FrameProfiler', name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> '_StageTimer':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+class FrameProfiler:
+    """Per-stage frame timing with a rolling window of samples"""
+
+    def __init__(self, window: int = Profiling.WINDOW_FRAMES, enabled: bool = True) -> None:
+        self.window = window
+        self.enabled = enabled
+
+        self.samples: Dict[str, Deque[float]] = {}
+        self.stage_order: List[str] = []
+        self._current: Dict[str, float] = {}
+        self._timers: Dict[str, _StageTimer] = {}
+        self.frame_count = 0
+
+    def measure(self, name: str) -> _StageTimer:
+        """Uso: `with profiler.measure("render"): ...`"""
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = _StageTimer(self, name)
+            self._timers[name] = timer
+        return timer
+
+    def record(self, name: str, seconds: float) -> None:
+        """Acumula o tempo de um estágio no frame atual"""
+        if not self.enabled:
+            return
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def end_frame(self) -> None:
+        """Fecha o frame atual e empurra as amostras para a janela"""
+        if not self.enabled:
+            return
+
+        for name, seconds in self._current.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self.samples[name] = samples
+                self.stage_order.append(name)
+            samples.append(seconds)
+
+        self._current.clear()
+        self.frame_count += 1
+
+    def get_stats(self) -> List[Tuple[str, float, float]]:
+        """Lista de (estágio, média ms, pior ms) na ordem em que foram vistos"""
+        stats = []
+        for name in self.stage_order:
+            samples = self.samples[name]
+            if not samples:
+                continue
+            average_ms = sum(samples) / len(samples) * 1000.0
+            worst_ms = max(samples) * 1000.0
+            stats.append((name, average_ms, worst_ms))
+        return stats
+
+    def get_stage_stats(self, name: str) -> Optional[Tuple[float, float]]:
+        samples = self.samples.get(name)
+        if not samples:
+            return None
+        return (sum(samples) / len(samples) * 1000.0, max(samples) * 1000.0)
+
+    def reset(self) -> None:
+        self.samples.clear()
+        self.stage_order.clear()
+        self._current.clear()
+        self.frame_count = 0
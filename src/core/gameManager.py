@@ -7,8 +7,11 @@ from src.ui.gameOverScreen import GameOverScreen
 from src.ui.nameInputScreen import NameInputScreen
 from src.core.enums import GameState
 from src.core.utils import create_overlay
-from src.core.constants import Rendering
+from src.core.constants import Rendering, Assets
 from src.core.leaderboard import Leaderboard
+from src.core.frameProfiler import FrameProfiler
+from src.core.displayUpdater import DisplayUpdater
+from src.core.fontManager import get_font_manager
 
 
 WIDTH: int = 950
@@ -31,8 +34,10 @@ class GameManager:
         self.state: GameState = GameState.PLAYING
         
         self.audio_manager = AudioManager()
+        self.profiler = FrameProfiler()
+        self.display_updater = DisplayUpdater((width, height))
         
-        self.game_world: GameWorld = GameWorld(self.screen, self.clock, self.width, self.height, self.audio_manager)
+        self.game_world: GameWorld = GameWorld(self.screen, self.clock, self.width, self.height, self.audio_manager, self.profiler)
         
         self.footstep_timer = 0
         
@@ -118,6 +123,10 @@ class GameManager:
 
     def _process_system_events(self) -> None:
         for event in pygame.event.get():
+            if self.state != GameState.PLAYING or event.type == pygame.WINDOWEXPOSED:
+                # Telas paradas só mudam com input (hover, digitação...) - redesenha tudo
+                self.display_updater.request_full_update()
+            
             if event.type == pygame.QUIT:
                 self.state = GameState.QUIT
                 
@@ -194,15 +203,13 @@ class GameManager:
         
         self.screen.blit(overlay, (0, 0))
         
-        try:
-            font_large = pygame.font.Font("assets/fonts/techno_hideo.ttf", Rendering.PAUSE_FONT_SIZE)
-            font_small = pygame.font.Font("assets/fonts/techno_hideo.ttf", Rendering.PAUSE_FONT_SIZE // 2)
-        except:
-            font_large = pygame.font.Font(None, Rendering.PAUSE_FONT_SIZE)
-            font_small = pygame.font.Font(None, Rendering.PAUSE_FONT_SIZE // 2)
+        # Fontes carregadas uma vez e textos reaproveitados pelo FontManager
+        font_manager = get_font_manager()
+        font_large = font_manager.get_font(Assets.FONT_TECHNO, Rendering.PAUSE_FONT_SIZE)
+        font_small = font_manager.get_font(Assets.FONT_TECHNO, Rendering.PAUSE_FONT_SIZE // 2)
             
         # Título "PAUSADO"
-        pause_text = font_large.render("PAUSADO", True, (255, 255, 255))
+        pause_text = font_manager.render(font_large, "PAUSADO", (255, 255, 255))
         pause_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
         self.screen.blit(pause_text, pause_rect)
         
@@ -215,7 +222,7 @@ class GameManager:
         
         y_offset = self.height // 2 + 10
         for control in controls:
-            control_text = font_small.render(control, True, (200, 200, 200))
+            control_text = font_manager.render(font_small, control, (200, 200, 200))
             control_rect = control_text.get_rect(center=(self.width // 2, y_offset))
             self.screen.blit(control_text, control_rect)
             y_offset += 35
@@ -234,12 +241,41 @@ class GameManager:
             return self.game_world.player.position
         return (0, 0)
 
+    def _draw_frame(self, show_debug: bool, show_detailed: bool) -> None:
+        profiler = self.profiler
+        with profiler.measure("render"):
+            self.game_world.render()
+        
+        if show_debug:
+            with profiler.measure("render_debug_hitboxes"):
+                self.game_world.render_debug_hitboxes(True, show_detailed)
+
+        if self.state == GameState.PLAYING:
+            with profiler.measure("hud"):
+                self.hud.player = self.game_world.player
+                self.hud.draw(elapsed_time=self.elapsed_time)
+        
+        elif self.state == GameState.GAME_OVER:
+            self.game_over_screen.draw()
+        
+        elif self.state == GameState.NAME_INPUT:
+            if self.name_input_screen:
+                self.name_input_screen.draw()
+        
+        elif self.state == GameState.PAUSED:
+            self._draw_pause_overlay()
+        
+        with profiler.measure("hud"):
+            self.hud.draw_debug_info(self)
+
     def run(self) -> None:
         try:
             while self.state != GameState.QUIT:
                 delta_time: float = self.clock.tick(self.target_fps) / 1000.0
+                profiler = self.profiler
                 
-                self.handle_events()
+                with profiler.measure("handle_events"):
+                    self.handle_events()
                 
                 if self.timer_running:
                     self.elapsed_time = pygame.time.get_ticks() - self.timer_start
@@ -257,32 +293,34 @@ class GameManager:
                         self._handle_game_completion()
                         self.audio_manager.stop_background_music()
 
-                self.game_world.render()
-                
-                # Renderizar hitboxes de debug se habilitado
+                # Debug (hitboxes e textos) habilitado?
                 show_debug = getattr(self, '_show_debug_info', False)
                 show_detailed = getattr(self, '_show_detailed_debug', False)
-                if show_debug:
-                    self.game_world.render_debug_hitboxes(True, show_detailed)
-
-                if self.state == GameState.PLAYING:
-                    self.hud.player = self.game_world.player
-                    self.hud.draw(elapsed_time=self.elapsed_time)
                 
-                elif self.state == GameState.GAME_OVER:
-                    self.game_over_screen.draw()
+                display = self.display_updater
+                camera = self.game_world.camera
+                # Trocou de tela, a câmera andou, mudou de sala ou ligou/desligou o debug: frame inteiro
+                display.set_view((self.state, camera.x, camera.y, id(self.game_world.current_room),
+                                  show_debug, show_detailed))
+                if show_debug:
+                    display.request_full_update()  # Textos e hitboxes de debug mudam todo frame
                 
-                elif self.state == GameState.NAME_INPUT:
-                    if self.name_input_screen:
-                        self.name_input_screen.update(delta_time)
-                        self.name_input_screen.draw()
+                if self.state == GameState.NAME_INPUT and self.name_input_screen:
+                    cursor_visible = self.name_input_screen.cursor_visible
+                    self.name_input_screen.update(delta_time)
+                    if self.name_input_screen.cursor_visible != cursor_visible:
+                        display.request_full_update()
                 
-                elif self.state == GameState.PAUSED:
-                    self._draw_pause_overlay()
+                # Telas paradas (pausa, game over, nome) só redesenham quando algo mudou
+                if self.state == GameState.PLAYING or display.needs_redraw:
+                    self._draw_frame(show_debug, show_detailed)
+                    display.mark_dirty_rects(self.game_world.take_dirty_rects())
+                    display.mark_dirty_rects(self.hud.take_dirty_rects())
                 
-                self.hud.draw_debug_info(self) 
+                with profiler.measure("flip"):
+                    display.present()
                 
-                pygame.display.flip()
+                profiler.end_frame()
         except Exception as e:
             print(f"Erro no jogo: {e}")
         finally:
@@ -290,10 +328,10 @@ class GameManager:
             sys.exit()
     
     def _restart_game(self) -> None:
-        """Restart the game by creating new game world"""
+        """Restart the game resetting the current world in place (no map reload)"""
         self.state = GameState.PLAYING
-        self.game_world = GameWorld(self.screen, self.clock, self.width, self.height, self.audio_manager)
-        self.hud = Hud(self.screen, self.game_world.player, self.clock)
+        self.game_world.reset()
+        self.hud.player = self.game_world.player
         self.audio_manager.play_background_music()
         
         # Reset timer
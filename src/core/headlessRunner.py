@@ -0,0 +1,172 @@
+"""
+Headless Simulation Runner for Linha Direta: The Game
+Steps the GameWorld without a window (dummy SDL video, fixed delta time,
+scripted input, no display flip) and reports wall time per stage
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import argparse
+import pygame
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+from src.core.constants import Simulation
+
+
+class ScriptedKeys:
+    """Substitui pygame.key.get_pressed() - indexável pelas constantes de tecla"""
+
+    def __init__(self, pressed: Iterable[int] = ()) -> None:
+        self.pressed: FrozenSet[int] = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+@dataclass
+class InputFrame:
+    """Input of a single simulated frame"""
+    keys: ScriptedKeys
+    mouse_pos: Tuple[int, int]
+    click: bool = False
+
+class ScriptedInput:
+    """Input source that plays back a fixed list of frames (looping)"""
+
+    def __init__(self, frames: Sequence[InputFrame]) -> None:
+        if not frames:
+            raise ValueError("ScriptedInput precisa de pelo menos um frame")
+        self.frames: List[InputFrame] = list(frames)
+
+    def get_frame(self, frame_index: int) -> InputFrame:
+        return self.frames[frame_index % len(self.frames)]
+
+    @classmethod
+    def default_script(cls, screen_size: Tuple[int, int]) -> 'ScriptedInput':
+        """Anda em quadrado (W, D, S, A), mira em círculo e atira em intervalos fixos"""
+        directions = [pygame.K_w, pygame.K_d, pygame.K_s, pygame.K_a]
+        hold = Simulation.DIRECTION_HOLD_FRAMES
+        center_x, center_y = screen_size[0] // 2, screen_size[1] // 2
+        radius = Simulation.MOUSE_ORBIT_RADIUS
+
+        frames = []
+        total = hold * len(directions)
+        for i in range(total):
+            angle = 2 * math.pi * i / total
+            mouse_pos = (int(center_x + radius * math.cos(angle)),
+                         int(center_y + radius * math.sin(angle)))
+            frames.append(InputFrame(
+                keys=ScriptedKeys([directions[i // hold]]),
+                mouse_pos=mouse_pos,
+                click=(i % Simulation.CLICK_INTERVAL_FRAMES == 0)
+            ))
+
+        return cls(frames)
+
+class HeadlessRunner:
+    """Runs GameWorld frame by frame without a display"""
+
+    STAGES = ("input", "update", "render")
+
+    def __init__(self, width: int = None, height: int = None,
+                 delta_time: float = Simulation.FIXED_DELTA_TIME,
+                 seed: int = Simulation.DEFAULT_SEED,
+                 script: Optional[ScriptedInput] = None) -> None:
+        # Precisa ser definido antes de inicializar o display
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+
+        from src.core.gameManager import WIDTH, HEIGHT
+        from src.world.core.gameWorld import GameWorld
+
+        self.width: int = width or WIDTH
+        self.height: int = height or HEIGHT
+        self.delta_time: float = delta_time
+
+        random.seed(seed)
+
+        self.screen: pygame.Surface = pygame.display.set_mode((self.width, self.height))
+        self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.game_world = GameWorld(self.screen, self.clock, self.width, self.height)
+        self.script: ScriptedInput = script or ScriptedInput.default_script((self.width, self.height))
+
+        self.frame_index: int = 0
+        self.stage_times: Dict[str, List[float]] = {stage: [] for stage in self.STAGES}
+
+    def step(self) -> None:
+        """Simula um frame: input -> update -> render (sem flip)"""
+        frame = self.script.get_frame(self.frame_index)
+
+        start = time.perf_counter()
+        self.game_world.process_player_input(frame.keys, self.delta_time)
+        self.game_world.process_player_mouse_movement(frame.mouse_pos)
+        if frame.click:
+            self.game_world.process_player_mouse(frame.mouse_pos)
+        after_input = time.perf_counter()
+
+        self.game_world.update(self.delta_time)
+        after_update = time.perf_counter()
+
+        with self.game_world.profiler.measure("render"):
+            self.game_world.render()
+        after_render = time.perf_counter()
+        self.game_world.profiler.end_frame()
+
+        self.stage_times["input"].append(after_input - start)
+        self.stage_times["update"].append(after_update - after_input)
+        self.stage_times["render"].append(after_render - after_update)
+        self.frame_index += 1
+
+    def run(self, frames: int = Simulation.DEFAULT_FRAMES) -> Dict[str, Dict[str, float]]:
+        for _ in range(frames):
+            self.step()
+        return self.get_report()
+
+    def get_report(self) -> Dict[str, Dict[str, float]]:
+        """Tempo por estágio em milissegundos (média, mínimo, máximo, total)"""
+        report = {}
+        for stage, samples in self.stage_times.items():
+            if not samples:
+                continue
+            report[stage] = {
+                "mean_ms": sum(samples) / len(samples) * 1000.0,
+                "min_ms": min(samples) * 1000.0,
+                "max_ms": max(samples) * 1000.0,
+                "total_ms": sum(samples) * 1000.0
+            }
+        return report
+
+    def format_report(self, report: Dict[str, Dict[str, float]]) -> str:
+        lines = [f"Frames: {self.frame_index} (dt fixo = {self.delta_time * 1000.0:.2f} ms)",
+                 f"{'Stage':<12}{'mean':>10}{'min':>10}{'max':>10}{'total':>12}"]
+        for stage, stats in report.items():
+            lines.append(f"{stage:<12}{stats['mean_ms']:>10.3f}{stats['min_ms']:>10.3f}"
+                         f"{stats['max_ms']:>10.3f}{stats['total_ms']:>12.1f}")
+
+        profiler = self.game_world.profiler
+        lines.append("")
+        lines.append(f"Estágios do GameWorld (últimos {profiler.window} frames)")
+        lines.append(f"{'Stage':<26}{'avg':>10}{'max':>10}")
+        for name, average_ms, worst_ms in profiler.get_stats():
+            lines.append(f"{name:<26}{average_ms:>10.3f}{worst_ms:>10.3f}")
+        return "\n".join(lines)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Roda o GameWorld sem janela e mede o tempo por estágio")
+    parser.add_argument("--frames", type=int, default=Simulation.DEFAULT_FRAMES)
+    parser.add_argument("--dt", type=float, default=Simulation.FIXED_DELTA_TIME, help="delta time fixo em segundos")
+    parser.add_argument("--seed", type=int, default=Simulation.DEFAULT_SEED)
+    args = parser.parse_args(argv)
+
+    runner = HeadlessRunner(delta_time=args.dt, seed=args.seed)
+    report = runner.run(args.frames)
+    print(runner.format_report(report))
+
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Image Cache for Linha Direta: The Game
+Process-wide cache of decoded surfaces keyed by (path, size), with optional
+LRU eviction under a byte budget
+"""
+
+import threading
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from src.core.constants import Cache
+
+ImageKey = Tuple[str, Optional[Tuple[int, int]]]
+
+
+class ImageCache:
+    """LRU cache of converted surfaces. Cached surfaces are shared - never draw on them.
+    Thread-safe, though room prefetch only parses off the main thread - surfaces are built on it"""
+
+    def __init__(self, max_bytes: Optional[int] = Cache.IMAGE_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes  # None = sem limite
+        self._entries: "OrderedDict[ImageKey, pygame.Surface]" = OrderedDict()
+        self.current_bytes = 0
+        self._lock = threading.RLock()
+
+        # Performance counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key: ImageKey) -> Optional[pygame.Surface]:
+        with self._lock:
+            surface = self._entries.get(key)
+            if surface is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+    def put(self, key: ImageKey, surface: pygame.Surface) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= self._surface_bytes(old)
+
+            self._entries[key] = surface
+            self.current_bytes += self._surface_bytes(surface)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove as entradas menos usadas até caber no orçamento (mantém pelo menos a mais recente)"""
+        if self.max_bytes is None:
+            return
+
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, surface = self._entries.popitem(last=False)
+            self.current_bytes -= self._surface_bytes(surface)
+            self.evictions += 1
+
+    def set_budget(self, max_bytes: Optional[int]) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+_image_cache_instance: Optional[ImageCache] = None
+
+def get_image_cache() -> ImageCache:
+    global _image_cache_instance
+    if _image_cache_instance is None:
+        _image_cache_instance = ImageCache()
+    return _image_cache_instance
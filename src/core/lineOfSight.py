@@ -0,0 +1,60 @@
+"""
+Line of Sight for Linha Direta: The Game
+Grid raycasts over the room's collision matrix, cached per (from tile, target tile)
+pair and invalidated whenever the target changes tile
+"""
+
+from typing import Dict, List, Tuple
+from src.core.mathUtils import traverse_grid
+
+TilePair = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+class LineOfSight:
+    """Visibilidade entre tiles: o raio vai do centro de um tile ao centro do outro,
+    então o resultado só depende do par de tiles e pode ser reaproveitado"""
+
+    def __init__(self, collision_matrix: List[List[bool]], tile_size: Tuple[int, int]) -> None:
+        self.matrix = collision_matrix
+        self.tile_width, self.tile_height = tile_size
+
+        self._cache: Dict[TilePair, bool] = {}
+        self._target_tile = None
+
+        # Performance counters
+        self.hits = 0
+        self.misses = 0
+
+    def get_tile(self, position) -> Tuple[int, int]:
+        return int(position[0] // self.tile_width), int(position[1] // self.tile_height)
+
+    def _tile_center(self, tile: Tuple[int, int]) -> Tuple[float, float]:
+        return (tile[0] + 0.5) * self.tile_width, (tile[1] + 0.5) * self.tile_height
+
+    def can_see(self, from_position, target_position) -> bool:
+        """True se nenhum tile sólido corta a linha até o alvo"""
+        target_tile = self.get_tile(target_position)
+        if target_tile != self._target_tile:
+            # Alvo trocou de tile - os raios antigos não servem mais
+            self._cache.clear()
+            self._target_tile = target_tile
+
+        from_tile = self.get_tile(from_position)
+        key = (from_tile, target_tile)
+        visible = self._cache.get(key)
+        if visible is not None:
+            self.hits += 1
+            return visible
+
+        self.misses += 1
+        visible = traverse_grid(self._tile_center(from_tile), self._tile_center(target_tile),
+                                self.matrix, self.tile_width, self.tile_height) is None
+        self._cache[key] = visible
+        return visible
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._target_tile = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,82 @@
+"""
+LOD Scheduler for Linha Direta: The Game
+Decides how often each entity ticks based on where it is relative to the camera:
+on-screen every frame, near off-screen at a reduced rate, far only for logic.
+Skipped frames accumulate their delta time so behaviour stays consistent
+"""
+
+import pygame
+from typing import Dict, Optional, Tuple
+from src.core.constants import LevelOfDetail
+
+
+class LodScheduler:
+    """Níveis de detalhe por entidade, escalonados para não acordar todas no mesmo frame"""
+
+    TIER_VISIBLE = 0
+    TIER_NEAR = 1
+    TIER_FAR = 2
+
+    def __init__(self, near_margin: int = LevelOfDetail.NEAR_MARGIN,
+                 near_interval: int = LevelOfDetail.NEAR_UPDATE_INTERVAL,
+                 far_interval: int = LevelOfDetail.FAR_UPDATE_INTERVAL) -> None:
+        self.near_margin = near_margin
+        self.intervals = {self.TIER_VISIBLE: 1, self.TIER_NEAR: near_interval, self.TIER_FAR: far_interval}
+
+        self.view_rect = pygame.Rect(0, 0, 0, 0)
+        self.near_rect = pygame.Rect(0, 0, 0, 0)
+        self.frame = 0
+
+        # id(entidade) -> delta_time acumulado desde o último tick / fase do escalonamento
+        self._accumulated: Dict[int, float] = {}
+        self._phases: Dict[int, int] = {}
+
+        # Performance counters (último frame)
+        self.ticks = 0
+        self.skipped = 0
+
+    def begin_frame(self, view_rect: pygame.Rect) -> None:
+        """Chamar uma vez por frame com a área visível da câmera"""
+        self.frame += 1
+        self.view_rect = view_rect
+        self.near_rect = view_rect.inflate(self.near_margin * 2, self.near_margin * 2)
+        self.ticks = 0
+        self.skipped = 0
+
+    def get_tier(self, rect: pygame.Rect) -> int:
+        if self.view_rect.colliderect(rect):
+            return self.TIER_VISIBLE
+        if self.near_rect.colliderect(rect):
+            return self.TIER_NEAR
+        return self.TIER_FAR
+
+    def schedule(self, entity, delta_time: float) -> Optional[Tuple[float, int]]:
+        """(delta_time acumulado, nível) se a entidade deve atualizar neste frame, senão None"""
+        key = id(entity)
+        accumulated = self._accumulated.get(key, 0.0) + delta_time
+        tier = self.get_tier(entity.rect)
+
+        phase = self._phases.get(key)
+        if phase is None:
+            phase = len(self._phases)
+            self._phases[key] = phase
+
+        if (self.frame + phase) % self.intervals[tier]:
+            self._accumulated[key] = accumulated
+            self.skipped += 1
+            return None
+
+        self._accumulated[key] = 0.0
+        self.ticks += 1
+        return accumulated, tier
+
+    def forget(self, entity) -> None:
+        """Descarta o tempo acumulado e a fase (entidade morreu, dormiu ou saiu da sala).
+        O id() pode ser reaproveitado por outro objeto - nada pode sobrar dele"""
+        key = id(entity)
+        self._accumulated.pop(key, None)
+        self._phases.pop(key, None)
+
+    def clear(self) -> None:
+        self._accumulated.clear()
+        self._phases.clear()
@@ -1,6 +1,7 @@
 import math
 import pygame
-from typing import Tuple, Union
+from array import array
+from typing import List, Optional, Tuple, Union
 
 def calculate_distance(pos1: Union[pygame.Vector2, Tuple[float, float]], 
                       pos2: Union[pygame.Vector2, Tuple[float, float]]) -> float:
@@ -259,4 +260,227 @@ def triangle_bounding_rect(triangle_vertices: Tuple[pygame.Vector2, pygame.Vecto
     min_y = min(v.y for v in triangle_vertices)
     max_y = max(v.y for v in triangle_vertices)
     
-    return pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
\ No newline at end of file
+    return pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+
+
+def merge_grid_rects(matrix: List[List[bool]], tile_width: int, tile_height: int) -> List[pygame.Rect]:
+    """
+    Junta células marcadas de uma matriz em retângulos maiores (greedy meshing).
+    
+    Cada retângulo cresce primeiro na horizontal e depois para baixo enquanto
+    a faixa inteira estiver marcada. A área coberta é exatamente a das células.
+    
+    Args:
+        matrix: Matriz [linha][coluna] de células marcadas (ex: colisão)
+        tile_width: Largura de uma célula em pixels
+        tile_height: Altura de uma célula em pixels
+    
+    Returns:
+        Lista de pygame.Rect em coordenadas de mundo
+    """
+    rects = []
+    if not matrix:
+        return rects
+    
+    rows = len(matrix)
+    used = [[False] * len(row) for row in matrix]
+    
+    for y in range(rows):
+        row = matrix[y]
+        cols = len(row)
+        x = 0
+        while x < cols:
+            if not row[x] or used[y][x]:
+                x += 1
+                continue
+            
+            # Corrida horizontal
+            end_x = x + 1
+            while end_x < cols and row[end_x] and not used[y][end_x]:
+                end_x += 1
+            
+            # Estende para baixo enquanto a corrida inteira estiver livre e marcada
+            end_y = y + 1
+            while end_y < rows:
+                next_row = matrix[end_y]
+                next_used = used[end_y]
+                if len(next_row) < end_x or not all(next_row[i] and not next_used[i] for i in range(x, end_x)):
+                    break
+                end_y += 1
+            
+            for mark_y in range(y, end_y):
+                used_row = used[mark_y]
+                for mark_x in range(x, end_x):
+                    used_row[mark_x] = True
+            
+            rects.append(pygame.Rect(x * tile_width, y * tile_height,
+                                     (end_x - x) * tile_width, (end_y - y) * tile_height))
+            x = end_x
+    
+    return rects
+
+def traverse_grid(start: Tuple[float, float], end: Tuple[float, float], matrix: List[List[bool]],
+                  tile_width: int, tile_height: int) -> Optional[Tuple[Tuple[int, int], Tuple[float, float]]]:
+    """
+    Percorre as células cruzadas pelo segmento start->end (DDA de Amanatides & Woo)
+    e para na primeira célula marcada.
+    
+    Args:
+        start: Posição inicial no mundo
+        end: Posição final no mundo
+        matrix: Matriz [linha][coluna] de células sólidas (ex: collision_matrix)
+        tile_width: Largura de uma célula em pixels
+        tile_height: Altura de uma célula em pixels
+    
+    Returns:
+        ((coluna, linha), ponto de impacto) da primeira célula sólida, ou None
+    """
+    rows = len(matrix)
+    if not rows:
+        return None
+    cols = len(matrix[0])
+    
+    x0, y0 = start
+    x1, y1 = end
+    dx = x1 - x0
+    dy = y1 - y0
+    
+    cell_x = int(x0 // tile_width)
+    cell_y = int(y0 // tile_height)
+    end_cell_x = int(x1 // tile_width)
+    end_cell_y = int(y1 // tile_height)
+    
+    if dx > 0:
+        step_x = 1
+        t_max_x = ((cell_x + 1) * tile_width - x0) / dx
+        t_delta_x = tile_width / dx
+    elif dx < 0:
+        step_x = -1
+        t_max_x = (cell_x * tile_width - x0) / dx
+        t_delta_x = -tile_width / dx
+    else:
+        step_x = 0
+        t_max_x = t_delta_x = math.inf
+    
+    if dy > 0:
+        step_y = 1
+        t_max_y = ((cell_y + 1) * tile_height - y0) / dy
+        t_delta_y = tile_height / dy
+    elif dy < 0:
+        step_y = -1
+        t_max_y = (cell_y * tile_height - y0) / dy
+        t_delta_y = -tile_height / dy
+    else:
+        step_y = 0
+        t_max_y = t_delta_y = math.inf
+    
+    t = 0.0
+    while True:
+        if 0 <= cell_y < rows and 0 <= cell_x < cols and matrix[cell_y][cell_x]:
+            return ((cell_x, cell_y), (x0 + dx * t, y0 + dy * t))
+        
+        if cell_x == end_cell_x and cell_y == end_cell_y:
+            return None
+        
+        if t_max_x < t_max_y:
+            t = t_max_x
+            cell_x += step_x
+            t_max_x += t_delta_x
+        else:
+            t = t_max_y
+            cell_y += step_y
+            t_max_y += t_delta_y
+        
+        # Proteção contra erro de ponto flutuante na última célula
+        if t > 1.0:
+            return None
+
+def build_summed_area_table(matrix: List[List[bool]]) -> List[array]:
+    """
+    Monta a tabela de áreas somadas (integral image) de uma matriz de células.
+    
+    table[y][x] guarda quantas células marcadas existem em [0, x) x [0, y),
+    então a tabela tem uma linha e uma coluna a mais que a matriz.
+    
+    Args:
+        matrix: Matriz [linha][coluna] de células marcadas
+    
+    Returns:
+        Lista de linhas array('i') com (linhas + 1) x (colunas + 1) entradas
+    """
+    rows = len(matrix) if matrix else 0
+    cols = len(matrix[0]) if rows else 0
+    
+    table = [array("i", [0]) * (cols + 1)]
+    for y in range(rows):
+        previous = table[y]
+        row = matrix[y]
+        current = array("i", [0]) * (cols + 1)
+        running = 0
+        for x in range(cols):
+            if row[x]:
+                running += 1
+            current[x + 1] = previous[x + 1] + running
+        table.append(current)
+    
+    return table
+
+def summed_area_sum(table: List[array], left: int, top: int, right: int, bottom: int) -> int:
+    """
+    Quantidade de células marcadas em [left..right] x [top..bottom] (inclusivo) em O(1).
+    Os índices já devem estar dentro da matriz; intervalos vazios retornam 0.
+    """
+    if right < left or bottom < top:
+        return 0
+    
+    below = table[bottom + 1]
+    above = table[top]
+    return below[right + 1] - above[right + 1] - below[left] + above[left]
+
+def compute_distance_field(matrix: List[List[bool]]) -> List[array]:
+    """
+    Distância (em tiles, métrica de Chebyshev / 8 vizinhos) de cada célula até
+    a parede mais próxima, via BFS de múltiplas origens.
+    
+    Células marcadas valem 0 e a borda do mapa conta como parede, então uma
+    célula livre encostada na borda vale 1.
+    
+    Args:
+        matrix: Matriz [linha][coluna] de células sólidas (ex: collision_matrix)
+    
+    Returns:
+        Lista de linhas array('i') com o mesmo formato da matriz
+    """
+    rows = len(matrix) if matrix else 0
+    cols = len(matrix[0]) if rows else 0
+    unset = -1
+    field = [array("i", [unset]) * cols for _ in range(rows)]
+    
+    queue = []
+    for y in range(rows):
+        for x in range(cols):
+            if matrix[y][x]:
+                field[y][x] = 0
+                queue.append((x, y))
+    
+    # Borda vem depois das paredes para manter a fila em ordem de distância
+    for y in range(rows):
+        for x in range(cols):
+            if field[y][x] == unset and (x == 0 or y == 0 or x == cols - 1 or y == rows - 1):
+                field[y][x] = 1
+                queue.append((x, y))
+    
+    head = 0
+    while head < len(queue):
+        x, y = queue[head]
+        head += 1
+        next_distance = field[y][x] + 1
+        
+        for ny in range(max(0, y - 1), min(rows, y + 2)):
+            row = field[ny]
+            for nx in range(max(0, x - 1), min(cols, x + 2)):
+                if row[nx] == unset:
+                    row[nx] = next_distance
+                    queue.append((nx, ny))
+    
+    return field
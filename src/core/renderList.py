@@ -0,0 +1,73 @@
+"""
+Render List for Linha Direta: The Game
+Collects the sprite draws of a frame and submits them to the target surface in
+one Surface.fblits / Surface.blits call instead of one Python-level blit each
+"""
+
+import pygame
+from typing import List, Optional, Tuple
+
+
+class RenderList:
+    """Fila de blits com a mesma interface de Surface.blit - pode ser passada no lugar da tela.
+    Desenhos imediatos (pygame.draw, etc.) precisam de flush() antes para manter a ordem"""
+
+    def __init__(self, target: pygame.Surface) -> None:
+        self.target = target
+        self._pending: List[tuple] = []
+        self._needs_area = False  # fblits só aceita pares (surface, destino)
+
+        # fblits existe no pygame-ce; no pygame clássico fica o blits(doreturn=False)
+        self._has_fblits = hasattr(target, "fblits")
+
+        # Com track_dirty ligado, guarda a área de tela de cada blit (para o DisplayUpdater)
+        self.track_dirty = False
+        self.dirty_rects: List[pygame.Rect] = []
+
+        # Performance counters
+        self.submitted = 0
+        self.flushes = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.target.get_size()
+
+    def blit(self, source: pygame.Surface, dest, area: Optional[pygame.Rect] = None) -> None:
+        """Enfileira um blit; dest pode ser Rect ou (x, y) (copiado - Rects reaproveitados são seguros)"""
+        if isinstance(dest, pygame.Rect):
+            dest = dest.topleft
+        if self.track_dirty:
+            self.dirty_rects.append(pygame.Rect(dest, source.get_size() if area is None else area.size))
+        if area is None:
+            self._pending.append((source, dest))
+        else:
+            self._pending.append((source, dest, area))
+            self._needs_area = True
+
+    def flush(self) -> None:
+        """Envia tudo o que foi enfileirado, na ordem, numa única chamada"""
+        pending = self._pending
+        if not pending:
+            return
+
+        if self._has_fblits and not self._needs_area:
+            self.target.fblits(pending)
+        else:
+            self.target.blits(pending, doreturn=False)
+
+        self.submitted += len(pending)
+        self.flushes += 1
+        self._pending = []
+        self._needs_area = False
+
+    def take_dirty_rects(self) -> List[pygame.Rect]:
+        """Rects registrados desde a última chamada"""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        return rects
+
+    def clear(self) -> None:
+        self._pending = []
+        self._needs_area = False
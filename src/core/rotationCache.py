@@ -0,0 +1,57 @@
+"""
+Rotation Cache for Linha Direta: The Game
+Pre-rotated sprites shared by every entity of the same archetype, keyed by
+(sprite key, animation frame, angle bucket) and built lazily on first use
+"""
+
+import pygame
+from typing import Dict, Hashable, Optional, Tuple
+from src.core.constants import Rendering
+
+RotationKey = Tuple[Hashable, int, int]
+
+
+class RotationCache:
+    """Quantiza o ângulo em N buckets e guarda o sprite já rotacionado.
+    As superfícies são compartilhadas - nunca desenhe nelas"""
+
+    def __init__(self, buckets: int = Rendering.ROTATION_BUCKETS) -> None:
+        self.buckets = buckets
+        self.degrees_per_bucket = 360.0 / buckets
+        self._entries: Dict[RotationKey, pygame.Surface] = {}
+
+        # Performance counters
+        self.hits = 0
+        self.misses = 0
+
+    def get_bucket(self, rotation: float) -> int:
+        return int(round((rotation % 360.0) / self.degrees_per_bucket)) % self.buckets
+
+    def get(self, sprite_key: Hashable, frame: int, surface: pygame.Surface, rotation: float) -> pygame.Surface:
+        """surface rotacionada por rotation (graus, mesmo sentido de Entity.rotation)"""
+        bucket = self.get_bucket(rotation)
+        key = (sprite_key, frame, bucket)
+
+        rotated = self._entries.get(key)
+        if rotated is not None:
+            self.hits += 1
+            return rotated
+
+        self.misses += 1
+        rotated = pygame.transform.rotate(surface, -bucket * self.degrees_per_bucket)
+        self._entries[key] = rotated
+        return rotated
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+_rotation_cache_instance: Optional[RotationCache] = None
+
+def get_rotation_cache() -> RotationCache:
+    global _rotation_cache_instance
+    if _rotation_cache_instance is None:
+        _rotation_cache_instance = RotationCache()
+    return _rotation_cache_instance
@@ -1,26 +1,41 @@
 import os
 import pygame
 from typing import Tuple, Optional
+from src.core.imageCache import get_image_cache
 
-def load_image(path: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+def load_image(path: str, size: Optional[Tuple[int, int]] = None, use_cache: bool = True) -> pygame.Surface:
+    """Carrega uma imagem (convert_alpha). Com cache, a superfície é compartilhada - não desenhe nela"""
     
     if not path.startswith('assets/'):
         full_path = os.path.join('assets', path)
     else:
         full_path = path
 
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(f"Imagem não encontrada: {full_path}")
+    size = tuple(size) if size else None
+    cache = get_image_cache() if use_cache else None
+    
+    if cache is not None:
+        image = cache.get((full_path, size))
+        if image is not None:
+            return image
 
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(f"Imagem não encontrada: {full_path}")
+    # A variante redimensionada reaproveita a imagem original já decodificada
+    image = cache.get((full_path, None)) if (cache is not None and size) else None
     
-    image = pygame.image.load(full_path)
+    if image is None:
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(f"Imagem não encontrada: {full_path}")
+        
+        image = pygame.image.load(full_path).convert_alpha()
+        if cache is not None:
+            cache.put((full_path, None), image)
     
     if size:
         image = pygame.transform.scale(image, size)
+        if cache is not None:
+            cache.put((full_path, size), image)
     
-    return image.convert_alpha()
+    return image
 
 def create_surface(size: Tuple[int, int], alpha: bool = True) -> pygame.Surface:
     """Cria uma superfície com ou sem alpha"""
@@ -1,9 +1,9 @@
 import math
 import pygame
-from typing import Tuple, Optional, Any, TYPE_CHECKING
+from typing import Callable, List, Tuple, Optional, Any, TYPE_CHECKING
 from src.model.entities.entity import Entity
 from src.core.utils import load_image
-from src.core.constants import Enemy as EnemyConst, Animation, Bullet as BulletConst
+from src.core.constants import Enemy as EnemyConst, Animation, Bullet as BulletConst, Assets
 from src.core.enums import EntityStatus
 from src.core.mathUtils import calculate_angle_to_target
 
@@ -25,7 +25,8 @@ class Enemy(Entity):
         sprite_config: dict = None,
         detection_range: float = EnemyConst.DETECTION_RANGE,
         drops: list = None,
-        hitbox_size: Optional[Tuple[int, int]] = None
+        hitbox_size: Optional[Tuple[int, int]] = None,
+        behavior: str = EnemyConst.DEFAULT_BEHAVIOR
     ) -> None:
         sprite_config = sprite_config or {}
         sprite_path = sprite_config.get("path", "assets/sprites/enemy2.png") 
@@ -36,39 +37,99 @@ class Enemy(Entity):
         
         self.detection_range = detection_range
         self.drops = drops or []
+        self.behavior = behavior
+        self.alerted: bool = False  # Viu o player e passou a persegui-lo
+        
+        # Aquece o cache com o sprite de morte para não decodificar o PNG no meio do frame
+        self._preload_dead_sprite()
         
         self.attack_range: float = EnemyConst.ATTACK_RANGE     
         self.attack_cooldown: float = 0.0    
         self.attack_interval: float = EnemyConst.ATTACK_INTERVAL_SECONDS    
         self.last_attack_time: float = 0.0
+        
+        # Inimigos dormindo não passam por update() - já nascem com o primeiro frame
+        self.update_visual()
     
-    def update(self, player_pos: Tuple[float, float], delta_time: float = 0.016) -> Optional['Bullet']:
+    def update(self, player_pos: Tuple[float, float], delta_time: float = 0.016,
+               can_see: Optional[Callable[[pygame.Vector2], bool]] = None,
+               animate: bool = True) -> Optional['Bullet']:
+        """animate=False (fora da tela, longe) pula animação e rotação do sprite - só a lógica roda"""
         if not self.is_alive():
             return None
             
-        # Update animation
-        self.update_animation(delta_time)
-            
         self.rotate_towards(player_pos)
         
         angle_rad = math.radians(self.rotation)
         self.direction = pygame.Vector2(math.cos(angle_rad), math.sin(angle_rad))
         
-        self.image = pygame.transform.rotate(self.base_image, -self.rotation)
-        self.rect = self.image.get_rect(center=self.rect.center)
+        if animate:
+            self.update_animation(delta_time)
+            self._apply_rotated_image()
         
         if self.attack_cooldown > 0:
             self.attack_cooldown -= delta_time
         
-        return self._try_attack_player(player_pos)
+        return self._try_attack_player(player_pos, can_see)
+    
+    def update_alert(self, player_pos: Tuple[float, float],
+                     can_see: Optional[Callable[[pygame.Vector2], bool]] = None) -> bool:
+        """Fica alerta ao enxergar o player dentro de detection_range - e continua alerta"""
+        if not self.alerted and self.get_distance_to(player_pos) <= self.detection_range:
+            self.alerted = can_see is None or can_see(self.position)
+        return self.alerted
+    
+    @property
+    def is_chaser(self) -> bool:
+        return self.behavior in EnemyConst.CHASE_BEHAVIORS
+    
+    def move_towards(self, target: Tuple[float, float], delta_time: float,
+                     obstacles: Optional[List[pygame.Rect]] = None) -> bool:
+        """Anda até target (no máximo speed * dt), deslizando nas paredes eixo a eixo.
+        Retorna True se andou"""
+        offset = pygame.Vector2(target) - self._position
+        distance = offset.length()
+        step = self.speed * delta_time
+        
+        if distance == 0 or step <= 0:
+            self.moving = False
+            return False
+        
+        if distance > step:
+            offset.scale_to_length(step)
+        
+        new_pos = pygame.Vector2(self._position)
+        moved = False
+        for axis_move in (pygame.Vector2(offset.x, 0), pygame.Vector2(0, offset.y)):
+            if not axis_move:
+                continue
+            candidate = new_pos + axis_move
+            if not self._collides_at(candidate, obstacles):
+                new_pos = candidate
+                moved = True
+        
+        if moved:
+            self.position = new_pos
+        self.moving = moved
+        return moved
+    
+    def _collides_at(self, position: pygame.Vector2, obstacles: Optional[List[pygame.Rect]]) -> bool:
+        if not obstacles:
+            return False
+        
+        probe = self.hitbox.copy()
+        probe.center = (int(position.x), int(position.y))
+        return probe.collidelist(obstacles) != -1
     
-    def _try_attack_player(self, player_pos: Tuple[float, float]) -> Optional['Bullet']:
+    def _try_attack_player(self, player_pos: Tuple[float, float],
+                           can_see: Optional[Callable[[pygame.Vector2], bool]] = None) -> Optional['Bullet']:
         if self.attack_cooldown > 0:
             return None
         
         distance = self._calculate_distance_to_player(player_pos)
         
-        if distance <= self.attack_range:
+        # Raycast só depois dos testes baratos (e cacheado pelo chamador)
+        if distance <= self.attack_range and (can_see is None or can_see(self.position)):
             self.attack_cooldown = self.attack_interval
             return self._shoot_at_player(player_pos)
         
@@ -113,13 +174,21 @@ class Enemy(Entity):
     
     def draw(self, screen: pygame.Surface) -> None:
         screen.blit(self.image, self.rect.topleft)
+    
+    def _preload_dead_sprite(self) -> None:
+        try:
+            load_image(Assets.DEAD_ENEMY_SPRITE, self.size)
+        except Exception as e:
+            print(f"Erro ao carregar imagem de inimigo morto: {e}")
         
     def set_dead_state(self) -> None:
         self.status = EntityStatus.DEAD.value
         
         try:
-            self.base_image = load_image("assets/sprites/dead_enemy.png", self.size)
-            self.image = pygame.transform.rotate(self.base_image, -self.rotation)
+            self.base_image = load_image(Assets.DEAD_ENEMY_SPRITE, self.size)
+            self.sprite_key = (Assets.DEAD_ENEMY_SPRITE, tuple(self.size), 1, 1)
+            self.current_frame = 0
+            self.image = self.get_rotated_image()
             old_center = self.rect.center
             self.rect = self.image.get_rect()
             self.rect.center = old_center
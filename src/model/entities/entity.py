@@ -7,6 +7,7 @@ from src.core.enums import EntityStatus
 from src.core.utils import load_image, create_surface
 from src.core.mathUtils import calculate_distance, calculate_angle_to_target, create_direction_vector
 from src.core.constants import Physics
+from src.core.rotationCache import get_rotation_cache
 
 class Entity(MovableObject):
     def __init__(
@@ -57,6 +58,10 @@ class Entity(MovableObject):
         self.current_frame = 0
         self.animation_timer = 0.0
         
+        # Arquétipo no cache de rotação - mesmo sprite, tamanho e layout => mesmos sprites rotacionados
+        sprite_path = sprite_config.get("path")
+        self.sprite_key = (sprite_path, tuple(size), self.frame_count, self.frame_rows) if sprite_path else None
+        
         # If it's an animated sprite, load frames
         if self.frame_count > 1 and image:
             self.frames = self._load_animation_frames(image, size)
@@ -154,9 +159,11 @@ class Entity(MovableObject):
             if hasattr(self.weapon, 'bullet_config'):
                 bullet_size = tuple(self.weapon.bullet_config.get('size', [8, 8]))
                 bullet_speed = self.weapon.bullet_config.get('speed', 500)
+                penetration = bool(self.weapon.bullet_config.get('penetration', False))
             else:
                 bullet_size = (8, 8)
                 bullet_speed = 500
+                penetration = False
             
             bullet = Bullet(
                 id=f"bullet_{self.id}",
@@ -165,7 +172,8 @@ class Entity(MovableObject):
                 speed=bullet_speed,
                 damage=self.weapon.damage,
                 rotation=rotation,
-                is_player_bullet=True  # Assume que Entity é para player por padrão
+                is_player_bullet=True,  # Assume que Entity é para player por padrão
+                penetration=penetration
             )
             bullet.directedSpeed = direction * bullet.speed
             return bullet
@@ -216,11 +224,22 @@ class Entity(MovableObject):
             math.sin(math.radians(self.rotation + Physics.DIRECTION_OFFSET_DEGREES))
         )
 
+    def get_rotated_image(self) -> pygame.Surface:
+        """Frame atual rotacionado - do cache compartilhado quando o sprite tem arquétipo"""
+        if self.sprite_key is None:
+            return pygame.transform.rotate(self.base_image, -self.rotation)
+        return get_rotation_cache().get(self.sprite_key, self.current_frame, self.base_image, self.rotation)
+    
+    def _apply_rotated_image(self) -> None:
+        """Troca self.image pelo sprite rotacionado mantendo o centro, sem alocar outro Rect"""
+        old_center = self.rect.center
+        self.image = self.get_rotated_image()
+        self.rect.size = self.image.get_size()
+        self.rect.center = old_center
+    
     def update_visual(self) -> None:
         if hasattr(self, 'base_image') and self.base_image:
-            old_center = self.rect.center
-            self.image = pygame.transform.rotate(self.base_image, -self.rotation)
-            self.rect = self.image.get_rect(center=old_center)
+            self._apply_rotated_image()
             
     def set_moving(self, is_moving: bool) -> None:
         self.moving = is_moving
@@ -141,10 +141,7 @@ class Player(Entity):
 
     def rotate_to_mouse(self, mouse_pos: Tuple[int, int]) -> None:
         self.rotate_towards(mouse_pos)
-
-        old_center = self.rect.center
-        self.image = pygame.transform.rotate(self.base_image, -self.rotation)
-        self.rect = self.image.get_rect(center=old_center)
+        self._apply_rotated_image()
 
     def heal(self, amount: int) -> None:
         old_health = self.health
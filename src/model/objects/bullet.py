@@ -5,10 +5,12 @@ from src.core.constants import Rendering, Bullet as BulletConst
 
 class Bullet(MovableObject):
     def __init__(self, id: str, position: Tuple[float, float], size: Tuple[int, int],
-                 speed: float, damage: int, rotation: float, is_player_bullet: bool = True) -> None:
+                 speed: float, damage: int, rotation: float, is_player_bullet: bool = True,
+                 penetration: bool = False) -> None:
         super().__init__(id, position, size, speed, rotation)
         self.damage: int = damage
         self.is_player_bullet: bool = is_player_bullet
+        self.penetration: bool = penetration  # Atravessa inimigos (ex: rifle)
         self.update_velocity()
 
     def update(self, delta_time: float, screen_width: int = Rendering.DEFAULT_WINDOW_WIDTH, screen_height: int = Rendering.DEFAULT_WINDOW_HEIGHT) -> bool:
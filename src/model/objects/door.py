@@ -32,8 +32,14 @@ class Door(GameObject):
     def unlock(self) -> None:
         self.locked = False
     
-    def draw(self, screen: pygame.Surface) -> None:
-        """Desenha a porta com cores baseadas no estado"""
+    def draw(self, screen: pygame.Surface, camera_offset: Tuple[float, float] = (0, 0)) -> pygame.Rect:
+        """Desenha a porta com cores baseadas no estado (camera_offset converte mundo -> tela).
+        Retorna a área da tela ocupada"""
+        rect = self.hitbox
+        if camera_offset != (0, 0):
+            rect = self.hitbox.copy()
+            rect.center = (int(self._position.x - camera_offset[0]), int(self._position.y - camera_offset[1]))
+        
         if self.locked:
             # Porta trancada - vermelha
             color = (200, 50, 50)  # Vermelho escuro
@@ -44,14 +50,14 @@ class Door(GameObject):
             border_color = (100, 150, 255)  # Azul claro para borda
         
         # Desenhar retângulo preenchido
-        pygame.draw.rect(screen, color, self.hitbox)
+        pygame.draw.rect(screen, color, rect)
         
         # Desenhar borda para destaque
-        pygame.draw.rect(screen, border_color, self.hitbox, 2)
+        pygame.draw.rect(screen, border_color, rect, 2)
         
         # Adicionar um pequeno indicador no centro
-        center_x, center_y = self.hitbox.center
-        indicator_size = min(self.hitbox.width, self.hitbox.height) // 4
+        center_x, center_y = rect.center
+        indicator_size = min(rect.width, rect.height) // 4
         indicator_rect = pygame.Rect(
             center_x - indicator_size // 2,
             center_y - indicator_size // 2,
@@ -73,3 +79,5 @@ class Door(GameObject):
                 (indicator_rect.right - 2, indicator_rect.top + 2)
             ]
             pygame.draw.lines(screen, (255, 255, 255), False, check_points, 2)
+        
+        return rect
@@ -1,7 +1,27 @@
+import copy
+import types
 import pygame
-from typing import Tuple, Optional, Union
+from typing import Any, Dict, Tuple, Optional, Union
 from src.core import mathUtils
 
+_SHARED_STATE_TYPES = (pygame.Surface, int, float, complex, str, bytes, bool, type(None),
+                       types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+def _copy_state_value(value: Any) -> Any:
+    """Cópia profunda do estado - nada mutável fica compartilhado entre o objeto e o snapshot.
+    Surfaces (sprites) e funções são compartilhadas de propósito"""
+    if isinstance(value, _SHARED_STATE_TYPES):
+        return value
+    if isinstance(value, (pygame.Rect, pygame.Vector2)):
+        return value.copy()
+    value_type = type(value)
+    if value_type in (list, tuple, set, frozenset):
+        return value_type(_copy_state_value(item) for item in value)
+    if value_type is dict:
+        return {key: _copy_state_value(item) for key, item in value.items()}
+    # Objetos do jogo (ex: Weapon) e containers menos comuns
+    return copy.deepcopy(value)
+
 class GameObject:
     def __init__(self, 
                  id: str, 
@@ -39,6 +59,15 @@ class GameObject:
                 hitbox_dimensions[1]
             )
     
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Captura o estado atual do objeto para ser restaurado depois (ex: restart)"""
+        return {key: _copy_state_value(value) for key, value in self.__dict__.items()}
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Volta ao estado capturado por snapshot_state() - o snapshot pode ser reutilizado"""
+        self.__dict__.clear()
+        self.__dict__.update({key: _copy_state_value(value) for key, value in state.items()})
+    
     @property
     def position(self) -> pygame.Vector2:
         """Getter para posição"""
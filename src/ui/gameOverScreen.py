@@ -5,14 +5,17 @@ import pygame
 from typing import Callable, List
 from src.core.enums import GameState
 from src.core.leaderboard import Leaderboard, LeaderboardEntry
+from src.core.fontManager import get_font_manager
 
 class GameOverScreen:
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.leaderboard = Leaderboard()
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
+        # Fontes e textos compartilhados com as outras telas
+        self.fonts = get_font_manager()
+        self.font_large = self.fonts.get_font(None, 72)
+        self.font_medium = self.fonts.get_font(None, 48)
+        self.font_small = self.fonts.get_font(None, 36)
         
         # Colors
         self.background_color = (20, 20, 30)  # Dark blue
@@ -76,12 +79,12 @@ class GameOverScreen:
         self.screen.fill(self.background_color)
         
         # Draw "GAME OVER" title
-        game_over_text = self.font_large.render("GAME OVER", True, self.red_accent)
+        game_over_text = self.fonts.render(self.font_large, "GAME OVER", self.red_accent)
         game_over_rect = game_over_text.get_rect(center=(self.center_x, 80))
         self.screen.blit(game_over_text, game_over_rect)
         
         # Draw subtitle
-        subtitle_text = self.font_medium.render("You were eliminated!", True, self.text_color)
+        subtitle_text = self.fonts.render(self.font_medium, "You were eliminated!", self.text_color)
         subtitle_rect = subtitle_text.get_rect(center=(self.center_x, 130))
         self.screen.blit(subtitle_text, subtitle_rect)
         
@@ -93,7 +96,7 @@ class GameOverScreen:
         pygame.draw.rect(self.screen, restart_color, self.restart_button)
         pygame.draw.rect(self.screen, self.text_color, self.restart_button, 2)  # Border
         
-        restart_text = self.font_small.render("Restart (R)", True, self.text_color)
+        restart_text = self.fonts.render(self.font_small, "Restart (R)", self.text_color)
         restart_text_rect = restart_text.get_rect(center=self.restart_button.center)
         self.screen.blit(restart_text, restart_text_rect)
         
@@ -102,19 +105,19 @@ class GameOverScreen:
         pygame.draw.rect(self.screen, quit_color, self.quit_button)
         pygame.draw.rect(self.screen, self.text_color, self.quit_button, 2)  # Border
         
-        quit_text = self.font_small.render("Quit (Q)", True, self.text_color)
+        quit_text = self.fonts.render(self.font_small, "Quit (Q)", self.text_color)
         quit_text_rect = quit_text.get_rect(center=self.quit_button.center)
         self.screen.blit(quit_text, quit_text_rect)
         
         # Draw instructions
-        instruction_text = self.font_small.render("Press R to restart or ESC to quit", True, self.text_color)
+        instruction_text = self.fonts.render(self.font_small, "Press R to restart or ESC to quit", self.text_color)
         instruction_rect = instruction_text.get_rect(center=(self.center_x, self.screen.get_height() - 50))
         self.screen.blit(instruction_text, instruction_rect)
     
     def _draw_leaderboard(self) -> None:
         """Draw the top 5 leaderboard"""
         # Title
-        leaderboard_title = self.font_medium.render("TOP 5 MELHORES TEMPOS", True, (255, 215, 0))  # Gold
+        leaderboard_title = self.fonts.render(self.font_medium, "TOP 5 MELHORES TEMPOS", (255, 215, 0))  # Gold
         title_rect = leaderboard_title.get_rect(center=(self.center_x, 180))
         self.screen.blit(leaderboard_title, title_rect)
         
@@ -122,7 +125,7 @@ class GameOverScreen:
         top_scores = self.leaderboard.get_top_scores(5)
         
         if not top_scores:
-            no_scores_text = self.font_small.render("Nenhum recorde ainda!", True, self.text_color)
+            no_scores_text = self.fonts.render(self.font_small, "Nenhum recorde ainda!", self.text_color)
             no_scores_rect = no_scores_text.get_rect(center=(self.center_x, 220))
             self.screen.blit(no_scores_text, no_scores_rect)
             return
@@ -136,7 +139,7 @@ class GameOverScreen:
             # Format: "1. PlayerName - 02:45"
             score_text = f"{rank}. {entry.name} - {entry.get_time_formatted()}"
             
-            score_surface = self.font_small.render(score_text, True, color)
+            score_surface = self.fonts.render(self.font_small, score_text, color)
             score_rect = score_surface.get_rect(center=(self.center_x, start_y + (i * 30)))
             self.screen.blit(score_surface, score_rect)
     
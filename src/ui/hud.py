@@ -1,46 +1,64 @@
 import pygame
-from typing import Any
-from src.core.constants import Rendering
+from typing import Any, List, Tuple
+from src.core.constants import Rendering, Profiling
+from src.core.renderList import RenderList
+from src.core.fontManager import get_font_manager
+from src.ui.hudWidgets import GlyphAtlas, TextWidget
 
 class Hud:
     def __init__(self, screen: pygame.Surface, player: Any, clock: pygame.time.Clock) -> None:
         self.screen: pygame.Surface = screen
         self.player: Any = player
         self.clock: pygame.time.Clock = clock
-        self.font: pygame.font.Font = pygame.font.Font(None, 36)
+        fonts = get_font_manager()
+        self.font: pygame.font.Font = fonts.get_font(None, Rendering.HUD_FONT_SIZE)
+        self.debug_font: pygame.font.Font = fonts.get_font(None, Rendering.DEBUG_FONT_SIZE)
+        self.render_list: RenderList = RenderList(screen)
+        self.render_list.track_dirty = True  # Textos mudam todo frame - o DisplayUpdater só envia essas áreas
+        
+        # Widgets guardam o texto renderizado e só chamam font.render quando o valor muda
+        self.health_widget = TextWidget(self.font, Rendering.HEALTH_POS, "Health: {}")
+        self.ammo_widget = TextWidget(self.font, Rendering.AMMO_POS, "Ammo: {}")
+        margin = Rendering.FPS_MARGIN
+        self.fps_widget = TextWidget(self.font, (screen.get_width() - margin, margin), "FPS: {}", anchor="topright")
+        # O timer muda todo frame - montado com glifos pré-renderizados
+        self.timer_atlas = GlyphAtlas(self.font)
+        
+        # Uma linha por widget nos painéis de debug (linhas fixas nunca re-renderizam)
+        self._debug_widgets: List[TextWidget] = []
+        self._timing_widgets: List[TextWidget] = []
 
     def draw(self, elapsed_time=None) -> None:
-        health_text: pygame.Surface = self.font.render(
-            f"Health: {self.player.health}", True, (255, 255, 255)
-        )
-        self.screen.blit(health_text, Rendering.HEALTH_POS)
-
-        ammo_text: pygame.Surface = self.font.render(
-            f"Ammo: {self.player.ammo}", True, (255, 255, 255)
-        )
-        self.screen.blit(ammo_text, Rendering.AMMO_POS)
-
-        fps: int = int(self.clock.get_fps())
-        fps_text: pygame.Surface = self.font.render(
-            f"FPS: {fps}", True, (255, 255, 255)
-        )
-        x = self.screen.get_width() - fps_text.get_width() - 10
-        y = 10
-        self.screen.blit(fps_text, (x, y))
+        render_list = self.render_list
+        
+        self.health_widget.set_value(self.player.health)
+        self.health_widget.draw(render_list)
+        
+        self.ammo_widget.set_value(self.player.ammo)
+        self.ammo_widget.draw(render_list)
+        
+        self.fps_widget.set_value(int(self.clock.get_fps()))
+        self.fps_widget.draw(render_list)
         
         if elapsed_time is not None:
             seconds = elapsed_time // 1000
             millis = elapsed_time % 1000
-            timer_text = self.font.render(f" {seconds}:{millis:03d}", True, (255, 255, 255))
-            self.screen.blit(timer_text, Rendering.TIMER_POS)
+            # Um rect sujo para o timer inteiro em vez de um por glifo
+            render_list.track_dirty = False
+            timer_rect = self.timer_atlas.draw(render_list, f" {seconds}:{millis:03d}", Rendering.TIMER_POS)
+            render_list.track_dirty = True
+            render_list.dirty_rects.append(timer_rect)
         
+        render_list.flush()
+
+    def take_dirty_rects(self) -> List[pygame.Rect]:
+        """Áreas desenhadas desde a última chamada (para o DisplayUpdater)"""
+        return self.render_list.take_dirty_rects()
 
     def draw_debug_info(self, game_manager) -> None:
         if not getattr(game_manager, '_show_debug_info', False):
             return
 
-        font = pygame.font.Font(None, 24)
-
         camera_pos = game_manager.get_camera_position()
         player_pos = game_manager.get_player_position()
         mouse_screen_pos = pygame.mouse.get_pos()
@@ -56,7 +74,7 @@ class Hud:
             f"Player: ({player_pos[0]:.0f}, {player_pos[1]:.0f})",
             f"Mouse (Screen): ({mouse_screen_pos[0]}, {mouse_screen_pos[1]})",
             f"Mouse (World): ({mouse_world_pos[0]:.0f}, {mouse_world_pos[1]:.0f})",
-            f"Bullets: {len(game_manager.game_world.bullets)}",
+            f"Bullets: {len(game_manager.game_world.bullet_system)}",
             f"FPS: {game_manager.clock.get_fps():.0f}",
             "",
             "Collision Optimization:",
@@ -84,10 +102,38 @@ class Hud:
             "Blue filled - Unlocked door"
         ]
 
-        y_offset = 10
-        for line in debug_lines:
-            text = font.render(line, True, (255, 255, 255))
-            bg_rect = pygame.Rect(10, y_offset, text.get_width() + 10, text.get_height())
-            pygame.draw.rect(self.screen, Rendering.TRANSPARENT_BLACK, bg_rect)
-            self.screen.blit(text, (15, y_offset))
-            y_offset += 25
+        white = Rendering.HUD_TEXT_COLOR
+        self._draw_panel(self._debug_widgets, [(line, white) for line in debug_lines], 15, 10)
+        
+        self._draw_frame_timing(game_manager.game_world.profiler)
+    
+    def _draw_panel(self, widgets: List[TextWidget], lines: List[Tuple[str, Tuple[int, int, int]]], x: int, y: int) -> None:
+        """Linhas (texto, cor) com fundo, a partir de (x, y)"""
+        while len(widgets) < len(lines):
+            widgets.append(TextWidget(self.debug_font, (x, y + len(widgets) * 25)))
+        
+        # Fundos desenhados na hora; textos vão juntos num único blits (as linhas não se sobrepõem)
+        for widget, (line, color) in zip(widgets, lines):
+            widget.set_value(line, color)
+            rect = widget.rect
+            pygame.draw.rect(self.screen, Rendering.TRANSPARENT_BLACK, (rect.x - 5, rect.y, rect.width + 10, rect.height))
+            widget.draw(self.render_list)
+        self.render_list.flush()
+    
+    def _draw_frame_timing(self, profiler) -> None:
+        """Coluna com média móvel e pior caso de cada estágio do frame"""
+        stats = profiler.get_stats()
+        if not stats:
+            return
+        
+        lines = [(f"Frame Timing (avg / max ms, {profiler.window}f):", (255, 255, 255))]
+        total_average = 0.0
+        for name, average_ms, worst_ms in stats:
+            total_average += average_ms
+            color = Profiling.OVER_BUDGET_COLOR if worst_ms > Profiling.FRAME_BUDGET_MS else (255, 255, 255)
+            lines.append((f"  {name}: {average_ms:.2f} / {worst_ms:.2f}", color))
+        
+        total_color = Profiling.OVER_BUDGET_COLOR if total_average > Profiling.FRAME_BUDGET_MS else (255, 255, 255)
+        lines.append((f"  total: {total_average:.2f} / {Profiling.FRAME_BUDGET_MS:.1f} budget", total_color))
+        
+        self._draw_panel(self._timing_widgets, lines, self.screen.get_width() - 340, 50)
@@ -0,0 +1,72 @@
+"""
+HUD Widgets for Linha Direta: The Game
+Text widgets that keep their rendered surface and only call font.render when
+the bound value changes, plus a glyph atlas for values that change every frame
+"""
+
+import pygame
+from typing import Any, Dict, Optional, Tuple
+from src.core.constants import Rendering
+
+Color = Tuple[int, int, int]
+
+
+class TextWidget:
+    """Texto preso a um valor: template.format(valor) só é renderizado quando o valor (ou a cor) muda"""
+
+    def __init__(self, font: pygame.font.Font, position: Tuple[int, int], template: str = "{}",
+                 color: Color = Rendering.HUD_TEXT_COLOR, anchor: str = "topleft") -> None:
+        self.font = font
+        self.position = position
+        self.template = template
+        self.color = color
+        self.anchor = anchor  # Ponto do rect preso em position (topleft, topright...)
+
+        self.value: Any = None
+        self.surface: Optional[pygame.Surface] = None
+        self.rect = pygame.Rect(position, (0, 0))
+        self._rendered_color: Optional[Color] = None
+
+        # Performance counters
+        self.renders = 0
+
+    def set_value(self, value: Any, color: Optional[Color] = None) -> bool:
+        """Atualiza o valor; retorna True se o texto precisou ser renderizado de novo"""
+        color = color or self.color
+        if self.surface is not None and value == self.value and color == self._rendered_color:
+            return False
+
+        self.value = value
+        self._rendered_color = color
+        self.surface = self.font.render(self.template.format(value), True, color)
+        self.rect = self.surface.get_rect(**{self.anchor: self.position})
+        self.renders += 1
+        return True
+
+    def draw(self, target) -> None:
+        """target pode ser a tela ou uma RenderList"""
+        if self.surface is not None:
+            target.blit(self.surface, self.rect)
+
+
+class GlyphAtlas:
+    """Glifos pré-renderizados de um conjunto fixo de caracteres - textos que mudam todo frame
+    (timer) viram só blits, sem font.render"""
+
+    def __init__(self, font: pygame.font.Font, characters: str = Rendering.HUD_GLYPHS,
+                 color: Color = Rendering.HUD_TEXT_COLOR) -> None:
+        self.glyphs: Dict[str, pygame.Surface] = {char: font.render(char, True, color) for char in characters}
+        self.advances: Dict[str, int] = {char: glyph.get_width() for char, glyph in self.glyphs.items()}
+        self.height = font.get_height()
+
+    def draw(self, target, text: str, position: Tuple[int, int]) -> pygame.Rect:
+        """Blita text caractere por caractere a partir de position; retorna a área ocupada"""
+        x, y = position
+        glyphs, advances = self.glyphs, self.advances
+        blit = target.blit
+
+        for char in text:
+            blit(glyphs[char], (x, y))
+            x += advances[char]
+
+        return pygame.Rect(position, (x - position[0], self.height))
@@ -4,6 +4,7 @@ import os
 from PIL import Image, ImageSequence
 from typing import Optional
 from src.core.utils import load_image
+from src.core.fontManager import get_font_manager
 
 pygame.init()
 
@@ -20,11 +21,9 @@ project_root = os.path.abspath(os.path.join(base_path, "../.."))
 font_path: str = os.path.join(project_root, 'assets', 'fonts', 'Neutrons.ttf')
 gif_path: str = os.path.join(project_root, 'assets', 'ui', 'menu', 'backgroundGif.gif')
 
-try:
-    font: pygame.font.Font = pygame.font.Font(font_path, 74)
-except Exception as e:
-    print(f"Erro ao carregar fonte: {e}")
-    font: pygame.font.Font = pygame.font.Font(None, 74) 
+# Cai na fonte padrão se o arquivo não carregar
+font_manager = get_font_manager()
+font: pygame.font.Font = font_manager.get_font(font_path, 74)
 
 try:
     gif: Image.Image = Image.open(gif_path)
@@ -58,10 +57,10 @@ def show_menu() -> None:
     screen.blit(frames[frame_index], (0, 0))
     frame_index = (frame_index + 1) % frame_count
 
-    title: pygame.Surface = font.render("Linha Direta", True, white)
-    option1: pygame.Surface = font.render("Start", True, white)
-    option2: pygame.Surface = font.render("Settings", True, white)
-    option3: pygame.Surface = font.render("Exit", True, white)
+    title: pygame.Surface = font_manager.render(font, "Linha Direta", white)
+    option1: pygame.Surface = font_manager.render(font, "Start", white)
+    option2: pygame.Surface = font_manager.render(font, "Settings", white)
+    option3: pygame.Surface = font_manager.render(font, "Exit", white)
 
     title_rect = title.get_rect(center=(screen_width // 2, screen_height // 2 - 150))
     option1_rect = option1.get_rect(center=(screen_width // 2, screen_height // 2 - 50))
@@ -3,14 +3,17 @@ Name Input Screen - Tela para o jogador inserir seu nome no leaderboard
 """
 import pygame
 from typing import Optional
+from src.core.fontManager import get_font_manager
 
 class NameInputScreen:
     def __init__(self, screen: pygame.Surface, game_time: int):
         self.screen = screen
         self.game_time = game_time
-        self.font_large = pygame.font.Font(None, 64)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
+        # Fontes e textos compartilhados com as outras telas
+        self.fonts = get_font_manager()
+        self.font_large = self.fonts.get_font(None, 64)
+        self.font_medium = self.fonts.get_font(None, 48)
+        self.font_small = self.fonts.get_font(None, 36)
         
         # Colors
         self.background_color = (20, 30, 40)  # Dark blue
@@ -103,18 +106,18 @@ class NameInputScreen:
         self.screen.fill(self.background_color)
         
         # Title
-        title_text = self.font_large.render("Novo Recorde!", True, self.green_accent)
+        title_text = self.fonts.render(self.font_large, "Novo Recorde!", self.green_accent)
         title_rect = title_text.get_rect(center=(self.center_x, self.center_y - 150))
         self.screen.blit(title_text, title_rect)
         
         # Time display
         time_text = f"Seu Tempo: {self.get_time_formatted()}"
-        time_surface = self.font_medium.render(time_text, True, self.text_color)
+        time_surface = self.fonts.render(self.font_medium, time_text, self.text_color)
         time_rect = time_surface.get_rect(center=(self.center_x, self.center_y - 100))
         self.screen.blit(time_surface, time_rect)
         
         # Input label
-        label_text = self.font_small.render("Digite seu nome:", True, self.text_color)
+        label_text = self.fonts.render(self.font_small, "Digite seu nome:", self.text_color)
         label_rect = label_text.get_rect(center=(self.center_x, self.center_y - 40))
         self.screen.blit(label_text, label_rect)
         
@@ -129,7 +132,7 @@ class NameInputScreen:
             display_text += "|"
         
         if display_text:
-            input_surface = self.font_medium.render(display_text, True, self.text_color)
+            input_surface = self.fonts.render(self.font_medium, display_text, self.text_color)
             # Center text in input box
             text_rect = input_surface.get_rect(center=self.input_box.center)
             self.screen.blit(input_surface, text_rect)
@@ -140,7 +143,7 @@ class NameInputScreen:
             pygame.draw.rect(self.screen, button_color, self.submit_button)
             pygame.draw.rect(self.screen, self.text_color, self.submit_button, 2)
             
-            submit_text = self.font_small.render("Salvar", True, self.text_color)
+            submit_text = self.fonts.render(self.font_small, "Salvar", self.text_color)
             submit_rect = submit_text.get_rect(center=self.submit_button.center)
             self.screen.blit(submit_text, submit_rect)
         
@@ -154,7 +157,7 @@ class NameInputScreen:
             
             y_offset = self.center_y + 180
             for instruction in instructions:
-                inst_surface = self.font_small.render(instruction, True, (180, 180, 180))
+                inst_surface = self.fonts.render(self.font_small, instruction, (180, 180, 180))
                 inst_rect = inst_surface.get_rect(center=(self.center_x, y_offset))
                 self.screen.blit(inst_surface, inst_rect)
                 y_offset += 30
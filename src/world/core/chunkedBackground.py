@@ -0,0 +1,81 @@
+"""
+Chunked Background for Linha Direta: The Game
+The baked room background split into fixed-size opaque chunks in the display
+format, so a frame only blits the chunks the camera can see
+"""
+
+import pygame
+from typing import Dict, Iterable, List, Tuple
+from src.core.constants import Rendering
+
+
+class ChunkedBackground:
+    """Background da sala em pedaços de chunk_size x chunk_size (as bordas podem ser menores)"""
+
+    def __init__(self, surface: pygame.Surface, chunk_size: int = Rendering.BACKGROUND_CHUNK_SIZE) -> None:
+        self.size: Tuple[int, int] = surface.get_size()
+        self.chunk_size = chunk_size
+        self.cols = -(-self.size[0] // chunk_size)
+        self.rows = -(-self.size[1] // chunk_size)
+
+        # O background é opaco - convert() (sem alpha) deixa o blit bem mais barato
+        convert = pygame.display.get_surface() is not None
+        self.chunks: List[List[pygame.Surface]] = []
+        for row in range(self.rows):
+            chunk_row = []
+            for col in range(self.cols):
+                area = pygame.Rect(col * chunk_size, row * chunk_size, chunk_size, chunk_size).clip(surface.get_rect())
+                chunk = surface.subsurface(area).copy()
+                chunk_row.append(chunk.convert() if convert else chunk)
+            self.chunks.append(chunk_row)
+
+    def _chunk_range(self, left: float, top: float, right: float, bottom: float) -> Tuple[range, range]:
+        """Colunas e linhas de chunks que cobrem [left, right) x [top, bottom) no mundo"""
+        size = self.chunk_size
+        first_col = max(0, int(left // size))
+        last_col = min(self.cols - 1, int((right - 1) // size))
+        first_row = max(0, int(top // size))
+        last_row = min(self.rows - 1, int((bottom - 1) // size))
+        return range(first_row, last_row + 1), range(first_col, last_col + 1)
+
+    def draw(self, screen, camera_offset: Tuple[float, float]) -> int:
+        """Blita só os chunks dentro da view da câmera; retorna quantos foram desenhados.
+        screen pode ser a tela ou uma RenderList"""
+        offset_x, offset_y = camera_offset
+        screen_width, screen_height = screen.get_size()
+
+        # Mesmo arredondamento do blit do background inteiro em (-offset_x, -offset_y)
+        origin_x = int(-offset_x)
+        origin_y = int(-offset_y)
+
+        rows, cols = self._chunk_range(-origin_x, -origin_y, screen_width - origin_x, screen_height - origin_y)
+        size = self.chunk_size
+        blit = screen.blit
+        drawn = 0
+
+        for row in rows:
+            chunk_row = self.chunks[row]
+            y = origin_y + row * size
+            for col in cols:
+                blit(chunk_row[col], (origin_x + col * size, y))
+                drawn += 1
+
+        return drawn
+
+    def redraw_cells(self, tmx_loader, cells: Iterable[Tuple[int, int]], room_current_tiles: dict = None) -> None:
+        """Redesenha tiles (animados) nos chunks que os contêm"""
+        tile_width, tile_height = tmx_loader.tilewidth, tmx_loader.tileheight
+        cells_by_chunk: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+
+        for x, y in cells:
+            left = x * tile_width
+            top = y * tile_height
+            rows, cols = self._chunk_range(left, top, left + tile_width, top + tile_height)
+            for row in rows:
+                for col in cols:
+                    cells_by_chunk.setdefault((col, row), []).append((x, y))
+
+        size = self.chunk_size
+        for (col, row), chunk_cells in cells_by_chunk.items():
+            tmx_loader.redraw_cells(self.chunks[row][col], chunk_cells, room_current_tiles,
+                                    origin=(col * size, row * size))
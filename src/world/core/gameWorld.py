@@ -9,18 +9,30 @@ from src.world.core.map import Map
 from src.world.core.room import Room
 from src.core.camera import Camera
 from src.core.entityFactory import EntityFactory
-from src.core.constants import World, Player, Enemy, Bullet, Items, Physics, FireDamage, get_random_drop_offset
+from src.core.constants import World, Player, Enemy, Bullet, Items, Physics, FireDamage, Rendering, get_random_drop_offset
 from src.core.enums import ItemType, ItemEffect, get_item_effect, get_item_display_name
 from src.core.collisionOptimizer import CollisionOptimizer
+from src.core.frameProfiler import FrameProfiler
+from src.core.bulletSystem import BulletSystem
+from src.core.flowField import FlowField
+from src.core.lineOfSight import LineOfSight
+from src.core.lodScheduler import LodScheduler
+from src.core.renderList import RenderList
+from src.core.fontManager import get_font_manager
+from src.core import mathUtils
 
 
 class GameWorld:
-    def __init__(self, screen: pygame.Surface, clock: pygame.time.Clock, width: int, height: int, audio_manager=None) -> None:
+    RENDER_ORDER = ("player", "enemy", "item", "door")
+    
+    def __init__(self, screen: pygame.Surface, clock: pygame.time.Clock, width: int, height: int, audio_manager=None,
+                 profiler: Optional[FrameProfiler] = None) -> None:
         self.screen: pygame.Surface = screen
         self.clock: pygame.time.Clock = clock
         self.width: int = width
         self.height: int = height
         self.audio_manager = audio_manager  # Referência para o AudioManager
+        self.profiler: FrameProfiler = profiler or FrameProfiler()
         
         self.map: Map = Map()
         self.entity_factory: EntityFactory = EntityFactory()
@@ -29,31 +41,50 @@ class GameWorld:
         
         # Initialize collision optimizer
         self.collision_optimizer = CollisionOptimizer(World.CAMERA_WORLD_WIDTH, World.CAMERA_WORLD_HEIGHT)
+        self._grid_enemies: Dict[str, Enemy] = {}  # Inimigos registrados no grid (chave -> inimigo)
+        self._awake_enemies: Dict[str, Enemy] = {}  # Só estes são atualizados; os demais dormem
+        self._wake_radius: float = 0.0  # Maior detection_range da sala
+        self._last_wake_position: Optional[Tuple[float, float]] = None
+        self._enemies_died: bool = False
+        self.lod_scheduler: LodScheduler = LodScheduler()  # Frequência de update por distância da tela
+        self.flow_field: Optional[FlowField] = None  # Caminhos até o player, compartilhado pelos inimigos
+        self.line_of_sight: Optional[LineOfSight] = None  # Raycasts inimigo -> player cacheados
         
         self.current_room: Optional[Room] = None
         self.player: Optional[Player] = None
-        self.bullets: List[Bullet] = []         
-        self.enemy_bullets: List[Bullet] = []   
-        self.render_queue: List = []
+        self.bullet_system: BulletSystem = BulletSystem()  # Balas do player e dos inimigos
+        # Lotes de desenho por tipo, montados a cada frame só com o que a câmera vê
+        self.render_batches: Dict[str, List] = {kind: [] for kind in self.RENDER_ORDER}
+        self._draw_routines = {
+            "player": self._draw_entity_batch,
+            "enemy": self._draw_entity_batch,
+            "item": self._draw_item_batch,
+            "door": self._draw_door_batch
+        }
+        self._draw_rect = pygame.Rect(0, 0, 0, 0)  # Rect de rascunho reaproveitado pelos lotes
+        self.render_list: RenderList = RenderList(screen)
+        self._dirty_tile_rects: List[pygame.Rect] = []  # Tiles animados redesenhados (mundo) desde o último render
         self.last_teleport_time: float = 0.0 
         self.start_time = pygame.time.get_ticks()
         
+        # Tempo simulado (soma dos delta_time) - mantém timers determinísticos
+        self.world_time: float = 0.0
+        
         # Fire damage system
         self.last_fire_damage_time: float = 0.0
         
         # Game completion flag
         self.game_completed: bool = False
         
+        # Estado do player logo após o spawn - usado pelo reset()
+        self._player_initial_state: Optional[dict] = None
+        
         self._initialize_world()
     
     def _initialize_world(self) -> None:
-        if self.map.rooms:
-            start_room = None
-            
-            for room in self.map.rooms:
-                if room.id == "Mapa1":
-                    start_room = room
-                    break
+        if self.map.room_ids:
+            # Só a sala inicial é carregada agora; as demais sob demanda
+            start_room = self.map.get_room_by_id("Mapa1")
             
             if not start_room:
                 for room in self.map.rooms:
@@ -61,7 +92,7 @@ class GameWorld:
                         start_room = room
                         break
             
-            if not start_room:
+            if not start_room and self.map.rooms:
                 start_room = self.map.rooms[0]
             
             self.current_room = start_room
@@ -89,6 +120,10 @@ class GameWorld:
             door.lock()
     
     def _spawn_player(self) -> None:
+        if self.player and self._player_initial_state:
+            self.player.restore_state(self._player_initial_state)
+            return
+        
         spawn_pos = self.current_room.spawn_position if self.current_room else (World.DEFAULT_SPAWN_X, World.DEFAULT_SPAWN_Y)
         
         self.player = self.entity_factory.create_player(spawn_pos)
@@ -98,18 +133,20 @@ class GameWorld:
             weapon = Weapon("pistol", "Pistola", Player.PISTOL_DAMAGE, Player.PISTOL_MAX_AMMO)
             self.player.weapon = weapon
             self.player.ammo = Player.STARTING_AMMO
+            self._player_initial_state = self.player.snapshot_state()
             
         else:
             print("ERRO: Falha ao criar player principal com EntityFactory!")
         
     # Input Processing
     
-    def process_player_input(self, keys: pygame.key.ScancodeWrapper) -> None:
+    def process_player_input(self, keys: pygame.key.ScancodeWrapper, delta_time: float = None) -> None:
         if not self.player or not self.current_room:
             return
 
-        delta_time = self.clock.get_time() / Physics.MILLISECONDS_TO_SECONDS
-        obstacles = self.current_room.get_wall_rects()
+        if delta_time is None:
+            delta_time = self.clock.get_time() / Physics.MILLISECONDS_TO_SECONDS
+        obstacles = self._get_nearby_obstacles(self.player, self.player.speed * delta_time)
         world_bounds = self.current_room.size  
 
         directions = []
@@ -123,6 +160,14 @@ class GameWorld:
         if keys[pygame.K_r]:
             self.player.reload()
     
+    def _get_nearby_obstacles(self, entity, move_distance: float) -> List[pygame.Rect]:
+        """Static rects an entity may hit moving up to move_distance this frame (via spatial grid)"""
+        query_rect = pygame.Rect(0, 0,
+                                 entity.size[0] + 2 * math.ceil(move_distance) + 2,
+                                 entity.size[1] + 2 * math.ceil(move_distance) + 2)
+        query_rect.center = (int(entity.position.x), int(entity.position.y))
+        return self.collision_optimizer.get_nearby_static_rects(query_rect)
+    
     def process_player_mouse_movement(self, mouse_pos: Tuple[int, int]) -> None:
         if not self.player:
             return
@@ -138,7 +183,7 @@ class GameWorld:
         world_mouse_pos = self.camera.screen_to_world(mouse_pos)
         bullet = self.player.shoot(world_mouse_pos)
         if bullet:
-            self.bullets.append(bullet)
+            self.bullet_system.spawn_bullet(bullet)
             return True
         return False
 
@@ -148,6 +193,10 @@ class GameWorld:
         if not self.current_room:
             return
         
+        if delta_time is None:
+            delta_time = self.clock.get_time() / Physics.MILLISECONDS_TO_SECONDS
+        self.world_time += delta_time
+        
         # Update collision optimizer frame (for cache management)
         self.collision_optimizer.update_frame()
         
@@ -156,58 +205,161 @@ class GameWorld:
             self.player.update(delta_time)
             self.camera.follow_target(self.player)
         
+        profiler = self.profiler
+        
         # Update game objects
-        self._update_enemies()
-        self._update_bullets()
-        self._update_enemy_bullets()
+        with profiler.measure("update_enemies"):
+            self._update_enemies(delta_time)
+        with profiler.measure("sync_collision_grid"):
+            self._sync_dynamic_objects()
+        with profiler.measure("update_bullets"):
+            self._update_bullets(delta_time)
+        with profiler.measure("enemy_bullet_hits"):
+            self._check_enemy_bullet_hits()
             
         # Update collisions and interactions
-        self._check_item_collisions()
-        self._check_door_collisions()
-        self._check_fire_damage(delta_time)
+        with profiler.measure("check_item_collisions"):
+            self._check_item_collisions()
+        with profiler.measure("check_door_collisions"):
+            self._check_door_collisions()
+        with profiler.measure("check_fire_damage"):
+            self._check_fire_damage(delta_time)
         
         # Update visuals
-        try:
-            self._update_tile_animations(delta_time)
-        except Exception as e:
-            print(f"Warning: Tile animation error: {e}")
-        
-        self._update_render_queue()
+        with profiler.measure("update_tile_animations"):
+            try:
+                self._update_tile_animations(delta_time)
+            except Exception as e:
+                print(f"Warning: Tile animation error: {e}")
+        
+        with profiler.measure("update_render_batches"):
+            self._update_render_batches()
     
-    def _update_enemies(self) -> None:
+    def _update_enemies(self, delta_time: float) -> None:
         if not self.player or not self.current_room:
             return
         
         player_pos = self.player.position
-        delta_time = self.clock.get_time() / Physics.MILLISECONDS_TO_SECONDS
         
-        enemies_alive_before = self.current_room.get_alive_enemies_count()
+        if self._enemies_died:
+            self._remove_dead_enemies()
         
-        for enemy in self.current_room.enemies[:]:
-            if enemy.is_alive():
-                enemy_bullet = enemy.update(player_pos, delta_time)
-                if enemy_bullet:
-                    self.enemy_bullets.append(enemy_bullet)
-                    # Tocar som de tiro do inimigo
-                    if self.audio_manager:
-                        self.audio_manager.play_sound('shoot')
-            else:
-                self.current_room.enemies.remove(enemy)
+        self._wake_nearby_enemies(player_pos)
         
-        enemies_alive_after = self.current_room.get_alive_enemies_count()
+        lod = self.lod_scheduler
+        lod.begin_frame(self.camera.get_view_rect())
+        
+        for key, enemy in list(self._awake_enemies.items()):
+            if enemy.get_distance_to(player_pos) > enemy.detection_range * Enemy.SLEEP_RANGE_FACTOR:
+                self._put_enemy_to_sleep(key, enemy)
+                continue
+            
+            # Fora da tela atualiza com menos frequência, com o delta_time acumulado
+            step = lod.schedule(enemy, delta_time)
+            if step is None:
+                continue
+            enemy_delta, tier = step
+            
+            if enemy.is_chaser:
+                self._move_chasing_enemy(enemy, enemy_delta)
+            enemy_bullet = enemy.update(player_pos, enemy_delta, self._can_see_player,
+                                        animate=tier != LodScheduler.TIER_FAR)
+            if enemy_bullet:
+                self.bullet_system.spawn_bullet(enemy_bullet)
+                # Tocar som de tiro do inimigo
+                if self.audio_manager:
+                    self.audio_manager.play_sound('shoot')
         
         # Verificar se todos os inimigos foram eliminados
-        if enemies_alive_after == 0 and not self.current_room.cleared:
+        if not self.current_room.enemies and not self.current_room.cleared:
             self.current_room.mark_cleared()
             self._unlock_room_doors()
             print("Sala limpa! As portas foram desbloqueadas.")
     
+    def _wake_nearby_enemies(self, player_pos: pygame.Vector2) -> None:
+        """Acorda de uma vez, via spatial grid, os inimigos que ficaram a detection_range do player.
+        Inimigos dormindo não andam, então só precisa rodar quando o player se move"""
+        position = (player_pos.x, player_pos.y)
+        if position == self._last_wake_position or not self._wake_radius:
+            return
+        self._last_wake_position = position
+        
+        size = int(self._wake_radius * 2) + 2
+        query_rect = pygame.Rect(0, 0, size, size)
+        query_rect.center = (int(player_pos.x), int(player_pos.y))
+        
+        for candidate in self.collision_optimizer.get_nearby_dynamic_objects(query_rect, "enemy"):
+            enemy = candidate.obj
+            if (candidate.id not in self._awake_enemies and enemy.is_alive()
+                    and enemy.get_distance_to(player_pos) <= enemy.detection_range):
+                self._awake_enemies[candidate.id] = enemy
+    
+    def _put_enemy_to_sleep(self, key: str, enemy: Enemy) -> None:
+        enemy.moving = False
+        enemy.alerted = False
+        del self._awake_enemies[key]
+        self.lod_scheduler.forget(enemy)
+    
+    def _remove_dead_enemies(self) -> None:
+        """Tira os mortos da sala, do grid e da lista de acordados (só em frames com mortes)"""
+        self._enemies_died = False
+        self.current_room.remove_dead_enemies()
+        
+        for key, enemy in list(self._grid_enemies.items()):
+            if not enemy.is_alive():
+                self.collision_optimizer.remove_object(key)
+                del self._grid_enemies[key]
+                self._awake_enemies.pop(key, None)
+                self.lod_scheduler.forget(enemy)
+    
+    def _on_enemy_killed(self, enemy_position: Tuple[float, float]) -> None:
+        self._enemies_died = True
+        self._generate_enemy_drop(enemy_position)
+    
+    def _move_chasing_enemy(self, enemy: Enemy, delta_time: float) -> None:
+        """Depois de avistar o player, segue o flow field até poder atirar nele"""
+        player_pos = self.player.position
+        if not enemy.update_alert(player_pos, self._can_see_player):
+            enemy.moving = False
+            return
+        
+        if enemy.get_distance_to(player_pos) <= enemy.attack_range and self._can_see_player(enemy.position):
+            enemy.moving = False
+            return
+        
+        # Só refaz o BFS quando o player troca de tile
+        self.flow_field.update(player_pos)
+        waypoint = self.flow_field.get_waypoint(enemy.position, player_pos)
+        if waypoint is None:
+            enemy.moving = False
+            return
+        
+        obstacles = self._get_nearby_obstacles(enemy, enemy.speed * delta_time)
+        enemy.move_towards(waypoint, delta_time, obstacles)
+    
+    def _can_see_player(self, position: pygame.Vector2) -> bool:
+        return self.line_of_sight.can_see(position, self.player.position)
+    
     def _unlock_room_doors(self) -> None:
         if not self.current_room:
             return
             
         for door in self.current_room.doors:
             door.unlock()
+        
+        self._prefetch_door_destinations()
+    
+    def _prefetch_door_destinations(self) -> None:
+        """Carrega em background as salas para onde as portas destrancadas levam"""
+        for door in self.current_room.doors:
+            destination = getattr(door, 'destination', None)
+            
+            if destination == "next_map":
+                next_id = self._get_next_map_id(self.current_room.id)
+                if next_id:
+                    self.map.prefetch_room(next_id)
+            elif destination and destination != "next_room":
+                self.map.prefetch_room(destination)
     
     def _generate_enemy_drop(self, enemy_position: Tuple[float, float]) -> None:
         if not self.current_room:
@@ -231,31 +383,25 @@ class GameWorld:
                 dropped_item.value = Items.AMMO_PACK_VALUE   
             
             self.current_room.items.append(dropped_item)
+            self._register_item(dropped_item)
             
             item_name = get_item_display_name(drop_type)
             print(f" {item_name} foi dropado!")
         else:
             print(" Falha ao criar o item dropado!")
     
-    def _update_bullets(self) -> None:
-        if not self.bullets:
+    def _update_bullets(self, dt: float) -> None:
+        """Move, culls and tile-tests every bullet, then resolves player bullets against enemies"""
+        if not len(self.bullet_system):
             return
         
-        dt = self.clock.get_time() / Physics.MILLISECONDS_TO_SECONDS
-        
         world_width = self.current_room.size[0] if self.current_room else self.width
         world_height = self.current_room.size[1] if self.current_room else self.height
         
-        for bullet in self.bullets[:]:
-            if not bullet.update(dt, world_width, world_height):
-                self.bullets.remove(bullet)
-                continue
-            
-            if self.current_room.check_collision((bullet.position.x, bullet.position.y), Bullet.COLLISION_CHECK_SIZE):
-                self.bullets.remove(bullet)
-                continue
+        self.bullet_system.update(dt, world_width, world_height, self.current_room)
         
-        self.current_room.handle_bullet_collisions(self.bullets, self._generate_enemy_drop)
+        self.current_room.handle_bullet_collisions(self.bullet_system, self.collision_optimizer,
+                                                   self._on_enemy_killed)
     
     def _check_item_collisions(self) -> None:
         if not self.player or not self.current_room:
@@ -270,13 +416,14 @@ class GameWorld:
                     self.player.add_ammo(item.value)
             
                 self.current_room.items.remove(item)
+                self.collision_optimizer.remove_object(f"item_{id(item)}")
 
     def _check_door_collisions(self) -> None:
         if not self.player or not self.current_room:
             return
         
-        current_time = pygame.time.get_ticks() / 1000.0
-        if current_time - self.last_teleport_time < 1.0:  
+        current_time = self.world_time
+        if current_time - self.last_teleport_time < World.TELEPORT_COOLDOWN_SECONDS:  
             return
         
         for door in self.current_room.doors:
@@ -306,11 +453,7 @@ class GameWorld:
                 return
         
         elif destination and destination != "next_room":
-            target_room = None
-            for room in self.map.rooms:
-                if room.id == destination:
-                    target_room = room
-                    break
+            target_room = self.map.get_room_by_id(destination)
             
             if target_room:
                 print(f"Teletransportando de {self.current_room.id} para {target_room.id} (destino específico)")
@@ -319,31 +462,36 @@ class GameWorld:
             else:
                 print(f"Sala de destino '{destination}' não encontrada!")
         
-        possible_rooms = [room for room in self.map.rooms if room != self.current_room]
-        if not possible_rooms:
+        possible_ids = [room_id for room_id in self.map.room_ids if room_id != self.current_room.id]
+        if not possible_ids:
             print("Nenhuma outra sala disponível para teleporte!")
             return
 
-        target_room = random.choice(possible_rooms)
+        target_room = self.map.get_room_by_id(random.choice(possible_ids))
+        if not target_room:
+            print("Falha ao carregar a sala de destino!")
+            return
         print(f"Teletransportando de {self.current_room.id} para {target_room.id} (aleatório)")
         self._teleport_to_room(target_room)
 
-    def _get_next_map(self) -> Optional[Room]:
-        current_id = self.current_room.id
-        
+    def _get_next_map_id(self, current_id: str) -> Optional[str]:
         if current_id == "Mapa1":
-            next_id = "Mapa2"
+            return "Mapa2"
         elif current_id == "Mapa2":
-            next_id = "Mapa 3"
+            return "Mapa 3"
         elif current_id == "Mapa 3":
             # Fim de jogo - jogador completou todos os mapas
-            return None  
-        else:
-            next_id = "Mapa1"
+            return None
+        return "Mapa1"
+
+    def _get_next_map(self) -> Optional[Room]:
+        next_id = self._get_next_map_id(self.current_room.id)
+        if next_id is None:
+            return None
         
-        for room in self.map.rooms:
-            if room.id == next_id:
-                return room
+        room = self.map.get_room_by_id(next_id)
+        if room:
+            return room
         
         print(f"Próximo mapa '{next_id}' não encontrado!")
         return None
@@ -371,8 +519,8 @@ class GameWorld:
             temp_rect = pygame.Rect(0, 0, self.player.size[0], self.player.size[1])
             temp_rect.center = (int(spawn_position[0]), int(spawn_position[1]))
             
-            # Use optimized collision check
-            collision = self.collision_optimizer.check_collision_optimized(temp_rect, static_only=True)
+            # O(1) lookup in the room's summed-area table
+            collision = self.current_room.rect_hits_walls(temp_rect)
             
             if collision:
                 spawn_position = self._find_safe_spawn(spawn_position)
@@ -385,27 +533,10 @@ class GameWorld:
             # Debug: print(f"Player posicionado em: {self.player.position}")
     
     def _find_safe_spawn(self, original_spawn: Tuple[float, float]) -> Tuple[float, float]:
-        spawn_x, spawn_y = original_spawn
-        
-        player_w, player_h = self.player.size
-        
-        for distance in [50, 100, 150, 200]:
-            for angle in range(0, 360, 30):
-                
-                rad = math.radians(angle)
-                test_x = spawn_x + distance * math.cos(rad)
-                test_y = spawn_y + distance * math.sin(rad)
-                
-                if (player_w//2 <= test_x <= self.current_room.size[0] - player_w//2 and 
-                    player_h//2 <= test_y <= self.current_room.size[1] - player_h//2):
-                    
-                    test_rect = pygame.Rect(0, 0, player_w, player_h)
-                    test_rect.center = (int(test_x), int(test_y))
-                    
-                    collision = self.collision_optimizer.check_collision_optimized(test_rect, static_only=True)
-                    if not collision:
-                        # Debug: print(f"Posição livre encontrada: ({test_x:.1f}, {test_y:.1f})")
-                        return (test_x, test_y)
+        """Nearest tile where the player fits, from the room's wall distance field"""
+        safe_position = self.current_room.find_nearest_free_position(original_spawn, self.player.size)
+        if safe_position is not None:
+            return safe_position
         
         print("Nenhuma posição livre encontrada, usando centro do mapa")
         return (self.current_room.size[0] // 2, self.current_room.size[1] // 2)
@@ -417,7 +548,9 @@ class GameWorld:
         
         # Clear existing static objects
         # Note: We'll keep a simple approach for now - just clear everything and re-add
-        self.collision_optimizer = CollisionOptimizer(World.CAMERA_WORLD_WIDTH, World.CAMERA_WORLD_HEIGHT)
+        # Grid sized to the room so cells map 1:1 to world space (rooms can exceed the camera world)
+        room_width, room_height = self.current_room.size
+        self.collision_optimizer = CollisionOptimizer(room_width, room_height)
         
         # Add wall rectangles as static collision objects
         wall_rects = self.current_room.get_wall_rects()
@@ -425,6 +558,45 @@ class GameWorld:
             wall_id = f"wall_{self.current_room.id}_{i}"
             self.collision_optimizer.add_static_object(wall_id, None, wall_rect)
         
+        self.flow_field = FlowField(self.current_room.collision_matrix, self.current_room.tile_size)
+        self.line_of_sight = LineOfSight(self.current_room.collision_matrix, self.current_room.tile_size)
+        
+        # Entidades vivas entram como objetos dinâmicos (ids por id() - os ids de entidade podem repetir)
+        # Todos começam dormindo; _wake_nearby_enemies acorda os próximos do player
+        self._grid_enemies = {}
+        self._awake_enemies = {}
+        self._last_wake_position = None
+        self._enemies_died = False
+        self.lod_scheduler.clear()
+        for enemy in self.current_room.enemies:
+            if enemy.is_alive():
+                key = f"enemy_{id(enemy)}"
+                self._grid_enemies[key] = enemy
+                self.collision_optimizer.add_dynamic_object(key, enemy, enemy.hitbox, kind="enemy")
+        
+        # Itens e portas entram no grid só para o culling do render
+        for item in self.current_room.items:
+            self._register_item(item)
+        for door in self.current_room.doors:
+            self.collision_optimizer.add_dynamic_object(f"door_{id(door)}", door, door.hitbox, kind="door")
+        
+        self._wake_radius = max((enemy.detection_range for enemy in self._grid_enemies.values()), default=0.0)
+        
+        self._sync_dynamic_objects()
+    
+    def _sync_dynamic_objects(self) -> None:
+        """Move the player and the awake enemies in the spatial grid (sleeping enemies don't move)"""
+        optimizer = self.collision_optimizer
+        
+        if self.player:
+            if optimizer.has_object("player"):
+                optimizer.update_object("player", self.player.hitbox)
+            else:
+                optimizer.add_dynamic_object("player", self.player, self.player.hitbox, kind="player")
+        
+        for key, enemy in self._awake_enemies.items():
+            optimizer.update_object(key, enemy.hitbox)
+        
         # Debug: print(f"Initialized collision optimizer with {len(wall_rects)} static objects")
     
     def get_collision_stats(self) -> Dict[str, int]:
@@ -434,38 +606,74 @@ class GameWorld:
 
     # Rendering
     
-    def _update_render_queue(self) -> None:
-        self.render_queue.clear()
+    def _update_render_batches(self) -> None:
+        """Typed draw batches of what the camera sees, gathered through the spatial grid"""
+        batches = self.render_batches
+        for batch in batches.values():
+            batch.clear()
         
         if not self.current_room:
             return
         
-        if self.player:
-            self.render_queue.append(self.player)
-        
-        for enemy in self.current_room.enemies:
-            if enemy.is_alive():
-                self.render_queue.append(enemy)
-        
-        self.render_queue.extend(self.current_room.items)
-        self.render_queue.extend(self.current_room.doors)
-        self.render_queue.extend(self.bullets)
-        self.render_queue.extend(self.enemy_bullets) 
-        
-        if len(self.current_room.items) > 0 and not hasattr(self, '_last_items_count'):
-            self._last_items_count = len(self.current_room.items)
-        elif len(self.current_room.items) != getattr(self, '_last_items_count', 0):
-            self._last_items_count = len(self.current_room.items)
+        view_rect = self.camera.get_view_rect()
+        query_rect = view_rect.inflate(Rendering.CULL_MARGIN * 2, Rendering.CULL_MARGIN * 2)
+        candidates = self.collision_optimizer.get_dynamic_objects_in_rect(query_rect)
         
+        # Ordem de registro no grid = ordem da sala (o grid devolve um conjunto; ids por id() mudam entre execuções)
+        for candidate in sorted(candidates, key=lambda collision_obj: collision_obj.order):
+            batch = batches.get(candidate.kind)
+            if batch is None:
+                continue
+            
+            obj = candidate.obj
+            if candidate.kind == "enemy" and not obj.is_alive():
+                continue
+            if view_rect.colliderect(self._get_draw_bounds(candidate.kind, obj)):
+                batch.append(obj)
+    
+    def _get_draw_bounds(self, kind: str, obj) -> pygame.Rect:
+        """World-space area an object covers when drawn"""
+        if kind == "item":
+            return self._get_item_rect(obj)
+        if kind == "door":
+            return obj.hitbox
+        return obj.rect
+    
+    @staticmethod
+    def _get_item_rect(item) -> pygame.Rect:
+        # Itens são desenhados com a posição como topo-esquerdo
+        size = item.image.get_size() if getattr(item, 'image', None) is not None else item.size
+        return pygame.Rect(item.position[0], item.position[1], size[0], size[1])
+    
+    def _register_item(self, item) -> None:
+        self.collision_optimizer.add_dynamic_object(f"item_{id(item)}", item, self._get_item_rect(item), kind="item")
+    
     def render(self) -> None:
+        """Background chunks, sprites and bullets go out through the render list in as few blits calls as possible"""
         self.screen.fill((88, 71, 71))
+        render_list = self.render_list
+        camera_offset = self.camera.get_offset()
         
         if self.current_room and self.current_room.background:
-            bg_pos = self.camera.world_to_screen((0, 0))
-            self.screen.blit(self.current_room.background, bg_pos)
-        
-        for obj in self.render_queue:
-            self._render_object_with_camera(obj)
+            # Só os chunks dentro da view da câmera
+            render_list.track_dirty = False
+            self.current_room.background.draw(render_list, camera_offset)
+        
+        # Daqui em diante tudo que muda de um frame pro outro entra nos rects sujos (só os deste render)
+        render_list.dirty_rects.clear()
+        render_list.track_dirty = True
+        if self._dirty_tile_rects:
+            origin_x, origin_y = int(-camera_offset[0]), int(-camera_offset[1])
+            render_list.dirty_rects.extend(rect.move(origin_x, origin_y) for rect in self._dirty_tile_rects)
+            self._dirty_tile_rects.clear()
+        
+        for kind in self.RENDER_ORDER:
+            batch = self.render_batches[kind]
+            if batch:
+                self._draw_routines[kind](batch, camera_offset)
+        
+        self.bullet_system.draw(render_list, camera_offset)
+        render_list.flush()
     
     def render_debug_hitboxes(self, show_debug: bool, show_detailed: bool = False) -> None:
         """Renderiza os hitboxes de debug se habilitado"""
@@ -504,29 +712,28 @@ class GameWorld:
             # Debug das estruturas/paredes do mundo
             self._draw_world_structures(camera_offset, show_detailed)
         
-        # Debug das balas
-        for bullet in self.bullets:
-            bullet.draw_debug_hitbox(self.screen, camera_offset, (255, 0, 255))  # Magenta
-            if show_detailed:
-                self._draw_hitbox_info(bullet, camera_offset, "Player Bullet")
-            
-        for enemy_bullet in self.enemy_bullets:
-            enemy_bullet.draw_debug_hitbox(self.screen, camera_offset, (255, 128, 0))  # Laranja
-            if show_detailed:
-                self._draw_hitbox_info(enemy_bullet, camera_offset, "Enemy Bullet")
+        # Debug das balas - Magenta (player) / Laranja (inimigos)
+        bullet_system = self.bullet_system
+        bullet_system.draw_debug(self.screen, camera_offset, (255, 0, 255), (255, 128, 0))
+        if show_detailed:
+            for index in range(len(bullet_system)):
+                label = "Player Bullet" if bullet_system.owner[index] == BulletSystem.OWNER_PLAYER else "Enemy Bullet"
+                self._draw_label((bullet_system.x[index], bullet_system.y[index]), camera_offset, label)
     
     def _draw_hitbox_info(self, obj, camera_offset, label):
         """Desenha informações sobre o hitbox de um objeto"""
+        self._draw_label(obj.position, camera_offset, label)
+    
+    def _draw_label(self, position, camera_offset, label):
+        """Desenha um rótulo acima de uma posição do mundo"""
         try:
-            import pygame
-            
             # Posição na tela
-            screen_x = int(obj.position[0] - camera_offset[0])
-            screen_y = int(obj.position[1] - camera_offset[1]) - 20  # Acima do objeto
+            screen_x = int(position[0] - camera_offset[0])
+            screen_y = int(position[1] - camera_offset[1]) - 20  # Acima do objeto
             
             # Criar texto
-            font = pygame.font.Font(None, 16)
-            text = font.render(label, True, (255, 255, 255))
+            font_manager = get_font_manager()
+            text = font_manager.render(font_manager.get_font(None, 16), label, (255, 255, 255))
             
             # Background para o texto
             text_rect = text.get_rect()
@@ -576,8 +783,8 @@ class GameWorld:
                     center_x = screen_rect.centerx
                     center_y = screen_rect.centery - 10
                     
-                    font = pygame.font.Font(None, 12)
-                    text = font.render("Wall", True, (255, 255, 255))
+                    font_manager = get_font_manager()
+                    text = font_manager.render(font_manager.get_font(None, 12), "Wall", (255, 255, 255))
                     
                     # Background pequeno para o texto
                     text_rect = text.get_rect()
@@ -602,8 +809,8 @@ class GameWorld:
                     center_x = screen_rect.centerx
                     center_y = screen_rect.centery - 10
                     
-                    font = pygame.font.Font(None, 12)
-                    text = font.render("Fire", True, (255, 100, 0))
+                    font_manager = get_font_manager()
+                    text = font_manager.render(font_manager.get_font(None, 12), "Fire", (255, 100, 0))
                     
                     text_rect = text.get_rect()
                     text_rect.center = (center_x, center_y)
@@ -615,56 +822,45 @@ class GameWorld:
             # Debug: print do erro para investigar
             print(f"Debug: Erro ao desenhar estruturas: {e}")
 
-    def _render_object_with_camera(self, obj) -> None:
-        if not hasattr(obj, 'position'):
-            return
-        
-        obj_pos = obj.position
-        if hasattr(obj_pos, 'x') and hasattr(obj_pos, 'y'):
-            obj_pos = (obj_pos.x, obj_pos.y)
-            
-        obj_size = getattr(obj, 'size', (32, 32))
-        if hasattr(obj, 'rect') and obj.rect is not None:
-            obj_size = (obj.rect.width, obj.rect.height)
-        elif hasattr(obj, 'hitbox') and obj.hitbox is not None:
-            obj_size = (obj.hitbox.width, obj.hitbox.height)
-            
-        if not self.camera.is_visible(obj_pos, obj_size):
-            return
-            
-        screen_pos = self.camera.world_to_screen(obj_pos)
-        
-        if hasattr(obj, 'image') and obj.image is not None:
-            if hasattr(obj, 'rect') and obj.rect is not None:
-                screen_rect = obj.rect.copy()
-                screen_rect.center = screen_pos
-                self.screen.blit(obj.image, screen_rect)
-            elif hasattr(obj, 'hitbox') and obj.hitbox is not None:
-                self.screen.blit(obj.image, screen_pos)
-            else:
-                self.screen.blit(obj.image, screen_pos)
-        elif hasattr(obj, 'hitbox') and obj.hitbox is not None:
-            # Objetos sem image mas com draw() method (como balas)
-            if hasattr(obj, 'draw'):
-                original_pos = obj.position if hasattr(obj, 'position') else None
-                obj.position = screen_pos
-                obj.draw(self.screen)
-                if original_pos:
-                    obj.position = original_pos
-        else:
-            if hasattr(obj, 'draw'):
-                original_pos = obj.position if hasattr(obj, 'position') else None
-                obj.position = screen_pos
-                obj.draw(self.screen)
-                if original_pos:
-                    obj.position = original_pos
+    def _draw_entity_batch(self, entities: List, camera_offset: Tuple[float, float]) -> None:
+        """Sprite already rotated by the entity, centred on its position"""
+        offset_x, offset_y = camera_offset
+        blit = self.render_list.blit
+        draw_rect = self._draw_rect
+        
+        for entity in entities:
+            position = entity.position
+            draw_rect.size = entity.rect.size
+            draw_rect.center = (position.x - offset_x, position.y - offset_y)
+            blit(entity.image, draw_rect)
+    
+    def _draw_item_batch(self, items: List, camera_offset: Tuple[float, float]) -> None:
+        offset_x, offset_y = camera_offset
+        blit = self.render_list.blit
+        
+        for item in items:
+            image = getattr(item, 'image', None)
+            if image is not None:
+                x, y = item.position
+                blit(image, (x - offset_x, y - offset_y))
+    
+    def _draw_door_batch(self, doors: List, camera_offset: Tuple[float, float]) -> None:
+        # Portas usam pygame.draw - o que já está na fila vai antes para manter a ordem
+        self.render_list.flush()
+        for door in doors:
+            self.render_list.dirty_rects.append(door.draw(self.screen, camera_offset))
+    
+    def take_dirty_rects(self) -> List[pygame.Rect]:
+        """Screen areas drawn by the last render() that can change between frames (sprites, bullets, doors, animated tiles)"""
+        return self.render_list.take_dirty_rects()
         
 
     # Utility Methods
     
     def change_room(self, room_index: int) -> None:
-        if 0 <= room_index < len(self.map.rooms):
-            self.current_room = self.map.rooms[room_index]
+        room_ids = self.map.room_ids
+        if 0 <= room_index < len(room_ids):
+            self.current_room = self.map.get_room_by_id(room_ids[room_index])
             if self.current_room:
                 room_width, room_height = self.current_room.size
                 self.camera.set_world_bounds(room_width, room_height)
@@ -689,45 +885,76 @@ class GameWorld:
             "id": self.current_room.id,
             "size": self.current_room.size,
             "enemies": len(self.current_room.enemies),
+            "awake_enemies": len(self._awake_enemies),
             "items": len(self.current_room.items),
             "doors": len(self.current_room.doors)
         }
     
-    def _update_enemy_bullets(self) -> None:
+    def _check_enemy_bullet_hits(self) -> None:
+        """Enemy bullets vs player: AABB first, then the player's triangular hitbox"""
         if not self.current_room or not self.player:
             return
         
-        delta_time = self.clock.get_time() / 1000.0
+        bullet_system = self.bullet_system
+        if not len(bullet_system):
+            return
+        
+        player_hitbox = self.player.hitbox
+        left, top, right, bottom = player_hitbox.left, player_hitbox.top, player_hitbox.right, player_hitbox.bottom
+        xs, ys, owners, sizes = bullet_system.x, bullet_system.y, bullet_system.owner, bullet_system.size
+        player_vertices = None
+        bullet_rect = pygame.Rect(0, 0, 0, 0)
         
-        for bullet in self.enemy_bullets[:]:
-            if not bullet.update(delta_time, self.width, self.height):
-                self.enemy_bullets.remove(bullet)
+        for index in range(len(xs) - 1, -1, -1):
+            if owners[index] != BulletSystem.OWNER_ENEMY:
                 continue
             
-            bullet_pos = (bullet.position.x, bullet.position.y)
-            bullet_size = (bullet.hitbox.width, bullet.hitbox.height)
-            if self.current_room.check_collision(bullet_pos, bullet_size):
-                self.enemy_bullets.remove(bullet)
+            size = sizes[index]
+            bullet_rect.update(xs[index], ys[index], size, size)
+            if (bullet_rect.right <= left or bullet_rect.left >= right or
+                    bullet_rect.bottom <= top or bullet_rect.top >= bottom):
                 continue
             
-            if bullet.collides_with(self.player):
-                damage = bullet.damage
-                self.player.take_damage(damage)
-                
-                # Play hurt sound
-                if self.audio_manager:
-                    self.audio_manager.play_sound('hurt')
-                
-                self.enemy_bullets.remove(bullet)
+            if self.player.hitbox_type == "triangle":
+                if player_vertices is None:
+                    player_vertices = self.player.get_triangle_vertices()
+                if player_vertices and not mathUtils.triangle_rect_collision(player_vertices, bullet_rect):
+                    continue
+            
+            self.player.take_damage(bullet_system.damage[index])
+            
+            # Play hurt sound
+            if self.audio_manager:
+                self.audio_manager.play_sound('hurt')
+            
+            bullet_system.remove(index)
     
     def is_game_completed(self) -> bool:
         """Retorna True se o jogador completou todos os mapas"""
         return self.game_completed
     
+    def reset(self) -> None:
+        """Restart in place: restores rooms and player, keeping backgrounds, matrices and sprites"""
+        self.bullet_system.clear()
+        for batch in self.render_batches.values():
+            batch.clear()
+        self._dirty_tile_rects.clear()  # Rects da sessão anterior não podem ser reenviados
+        
+        self.map.reset_loaded_rooms()
+        
+        self.world_time = 0.0
+        self.last_teleport_time = 0.0
+        self.last_fire_damage_time = 0.0
+        self.game_completed = False
+        self.start_time = pygame.time.get_ticks()
+        
+        self.current_room = None
+        self._initialize_world()
+    
     def cleanup(self) -> None:
-        self.bullets.clear()
-        self.enemy_bullets.clear()  
-        self.render_queue.clear()
+        self.bullet_system.clear()
+        for batch in self.render_batches.values():
+            batch.clear()
         print("GameWorld limpo")
     
     # ==========================================
@@ -744,7 +971,7 @@ class GameWorld:
         is_on_fire = self.current_room.check_fire_damage(player_rect)
         
         if is_on_fire:
-            current_time = pygame.time.get_ticks() / 1000.0  # Convert to seconds
+            current_time = self.world_time
             
             # Apply damage every DAMAGE_INTERVAL seconds
             if current_time - self.last_fire_damage_time >= FireDamage.DAMAGE_INTERVAL:
@@ -763,6 +990,10 @@ class GameWorld:
             old_frames = self.current_room.current_tile_frames.copy()
             self.current_room.update_tile_animations(delta_time)
             
-            # Only update background if frames actually changed (for performance)
-            if self.current_room.current_tile_frames != old_frames:
-                self.current_room.update_background()
+            # Only redraw the cells whose animation frame actually changed
+            changed_gids = [gid for gid, frame in self.current_room.current_tile_frames.items()
+                            if old_frames.get(gid) != frame]
+            if changed_gids:
+                tile_width, tile_height = self.current_room.tile_size
+                for x, y in self.current_room.update_background(changed_gids):
+                    self._dirty_tile_rects.append(pygame.Rect(x * tile_width, y * tile_height, tile_width, tile_height))
@@ -1,8 +1,11 @@
 import os
 import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from src.world.loaders.tiledLoader import TiledLoader
 from src.world.core.room import Room
+from src.world.core.chunkedBackground import ChunkedBackground
 from src.core.entityFactory import EntityFactory
 
 class Map:
@@ -12,41 +15,129 @@ class Map:
         
         self.entity_factory = EntityFactory()
         
-        self.rooms: List[Room] = self._load_rooms()
+        # Salas são carregadas sob demanda - no início só indexamos os arquivos .tmx
+        self._room_paths: Dict[str, str] = self._index_rooms()
+        self._loaded_rooms: Dict[str, Room] = {}
+        self._failed_rooms: set = set()
+        self._lock = threading.Lock()
+        
+        # Prefetch em background (uma thread, criada só quando necessário)
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, Future] = {}
+        
         self.current_room: Optional[Room] = None
         self.sequence: List[Room] = []
         
 
-    def _load_rooms(self) -> List[Room]:
-        rooms: List[Room] = []
+    def _index_rooms(self) -> Dict[str, str]:
+        room_paths: Dict[str, str] = {}
         
         if not os.path.exists(self.rooms_folder):
             print(f"Pasta não encontrada: {self.rooms_folder}")
-            return rooms
+            return room_paths
         
-        for filename in os.listdir(self.rooms_folder):
+        for filename in sorted(os.listdir(self.rooms_folder)):
             if filename.endswith('.tmx'):
-                file_path = os.path.join(self.rooms_folder, filename)
-                room = self._load_tmx_room(file_path)
-                if room:
-                    rooms.append(room)
-                    print(f"Sala carregada: {room.id}")
+                room_id = os.path.splitext(filename)[0]
+                room_paths[room_id] = os.path.join(self.rooms_folder, filename)
         
-        if not rooms:
-            print("Nenhuma sala foi carregada")
+        if not room_paths:
+            print("Nenhuma sala foi encontrada")
         
-        return rooms
+        return room_paths
+
+    @property
+    def room_ids(self) -> List[str]:
+        """IDs de todas as salas disponíveis em disco (sem carregá-las)"""
+        return list(self._room_paths)
+
+    @property
+    def rooms(self) -> List[Room]:
+        """Todas as salas - carrega as que ainda não foram carregadas"""
+        rooms = [self.get_room_by_id(room_id) for room_id in self._room_paths]
+        return [room for room in rooms if room is not None]
 
-    def _load_tmx_room(self, tmx_path: str) -> Optional[Room]:
+    @property
+    def loaded_rooms(self) -> List[Room]:
+        with self._lock:
+            return list(self._loaded_rooms.values())
+
+    def is_room_loaded(self, room_id: str) -> bool:
+        with self._lock:
+            return room_id in self._loaded_rooms
+
+    def get_room_by_id(self, room_id: str) -> Optional[Room]:
+        """Retorna a sala, carregando-a no primeiro acesso (ou terminando o prefetch em andamento)"""
+        with self._lock:
+            room = self._loaded_rooms.get(room_id)
+            if room is not None or room_id in self._failed_rooms:
+                return room
+            pending = self._pending.pop(room_id, None)
+        
+        return self._load_room(room_id, pending)
+
+    def prefetch_room(self, room_id: str) -> None:
+        """Agenda o parse de uma sala numa thread de background (o resto fica para _load_room)"""
+        with self._lock:
+            if (room_id not in self._room_paths or room_id in self._loaded_rooms
+                    or room_id in self._failed_rooms or room_id in self._pending):
+                return
+            
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="room-prefetch")
+            
+            self._pending[room_id] = self._prefetch_executor.submit(self._parse_tmx_room, self._room_paths[room_id])
+
+    def _load_room(self, room_id: str, pending: Optional[Future] = None) -> Optional[Room]:
+        """Thread principal: usa o parse do prefetch (ou parseia agora) e cria surfaces e entidades"""
+        tmx_path = self._room_paths.get(room_id)
+        tmx_loader = None
+        if pending is not None:
+            tmx_loader = pending.result()
+        elif tmx_path:
+            tmx_loader = self._parse_tmx_room(tmx_path)
+        
+        room = self._build_tmx_room(tmx_path, tmx_loader) if tmx_loader else None
+        
+        with self._lock:
+            if room is None:
+                self._failed_rooms.add(room_id)
+                return None
+            
+            room = self._loaded_rooms.setdefault(room_id, room)
+        
+        print(f"Sala carregada: {room.id}")
+        return room
+
+    @staticmethod
+    def _parse_tmx_room(tmx_path: str) -> Optional[TiledLoader]:
+        """Só Python puro (roda na thread de prefetch): TMX/TSX, camadas de GIDs e matrizes.
+        Nada de Surfaces, caches de sprites ou entidades aqui - pygame não é thread-safe"""
+        try:
+            tmx_loader = TiledLoader(tmx_path, load_images=False)
+            
+            # Monta (e guarda no loader) as matrizes e o índice de tiles animados
+            tmx_loader.get_collision_matrix()
+            tmx_loader.get_fire_matrix()
+            tmx_loader.get_animated_cells()
+            
+            return tmx_loader
+            
+        except Exception as e:
+            print(f"Erro ao carregar TMX {tmx_path}: {e}")
+            return None
+
+    def _build_tmx_room(self, tmx_path: str, tmx_loader: TiledLoader) -> Optional[Room]:
+        """Parte que mexe com pygame: imagens dos tilesets, background em chunks e entidades"""
         try:
-            tmx_loader = TiledLoader(tmx_path)
+            tmx_loader.load_images()
             
             room_id = os.path.splitext(os.path.basename(tmx_path))[0]
             room_size = tmx_loader.get_map_size_pixels()
             collision_matrix = tmx_loader.get_collision_matrix()
             fire_matrix = tmx_loader.get_fire_matrix()
             animated_tiles = tmx_loader.get_animated_tiles()
-            background = tmx_loader.create_background()
+            background = ChunkedBackground(tmx_loader.create_background())
             
             entities_data = tmx_loader.get_objects_data()
             room_entities = self.entity_factory.create_room_entities(entities_data)
@@ -68,6 +159,7 @@ class Map:
                 tmx_objects_data=entities_data,
                 tmx_loader=tmx_loader
             )
+            room.save_initial_state()
             
             return room
             
@@ -149,9 +241,6 @@ class Map:
         
         return None
 
-    def get_room_by_id(self, room_id: str) -> Optional[Room]:
-        return next((room for room in self.rooms if room.id == room_id), None)
-
     def is_sequence_complete(self) -> bool:
         if not self.sequence:
             return False
@@ -176,14 +265,19 @@ class Map:
         current_progress = self.get_sequence_progress()
         
         return {
-            "total_rooms": len(self.rooms),
+            "total_rooms": len(self._room_paths),
             "sequence_length": len(self.sequence),
             "current_room": self.current_room.id if self.current_room else None,
             "progress": f"{current_progress[0]}/{current_progress[1]}",
             "is_complete": self.is_sequence_complete(),
-            "rooms_loaded": [room.id for room in self.rooms]
+            "rooms_loaded": [room.id for room in self.loaded_rooms]
         }
 
+    def reset_loaded_rooms(self) -> None:
+        """Restaura o estado inicial de todas as salas já carregadas (sem reparsear nada)"""
+        for room in self.loaded_rooms:
+            room.restore_initial_state()
+
     def reset_sequence(self) -> None:
         for room in self.sequence:
             room.visited = False
@@ -195,6 +289,10 @@ class Map:
     def cleanup(self) -> None:
         self.sequence.clear()
         self.current_room = None
+        
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
 
     def __str__(self) -> str:
         current_name = self.current_room.id if self.current_room else "Nenhuma"
@@ -1,6 +1,10 @@
-from typing import List, Optional, Any, Tuple
+import math
+from typing import List, Optional, Any, Set, Tuple, Iterable
 import pygame
-from src.model.objects.bullet import Bullet
+from src.core.bulletSystem import BulletSystem
+from src.core.collisionOptimizer import CollisionOptimizer
+from src.core.mathUtils import merge_grid_rects, build_summed_area_table, summed_area_sum, compute_distance_field
+from src.world.core.chunkedBackground import ChunkedBackground
 
 class Room:
     def __init__(
@@ -14,7 +18,7 @@ class Room:
         player: Optional[Any],
         cleared: bool,
         visited: bool,
-        background: pygame.Surface,
+        background: ChunkedBackground,
         collision_matrix: Optional[List[List[bool]]] = None,
         fire_matrix: Optional[List[List[bool]]] = None,
         animated_tiles: Optional[dict] = None,
@@ -24,7 +28,7 @@ class Room:
     ) -> None:
         self.id: str = id
         self.size: Tuple[int, int] = size
-        self.background: pygame.Surface = background
+        self.background: ChunkedBackground = background
         self.tile_size: Tuple[int, int] = tile_size
         
         self.cleared: bool = cleared
@@ -41,6 +45,13 @@ class Room:
         self._wall_rects_cache: Optional[List[pygame.Rect]] = None
         self._fire_rects_cache: Optional[List[pygame.Rect]] = None
         
+        # Tabelas de áreas somadas: "tem tile sólido/fogo nesta área?" em O(1)
+        self.collision_sat = build_summed_area_table(collision_matrix)
+        self.fire_sat = build_summed_area_table(fire_matrix)
+        
+        # Distância (em tiles) até a parede mais próxima - spawn seguro e desvio de paredes
+        self.distance_field = compute_distance_field(collision_matrix)
+        
         # Animation state tracking
         self.animation_time: float = 0.0
         self.current_tile_frames: dict = {}  # tile_gid -> current_frame_index
@@ -49,6 +60,8 @@ class Room:
         self.tmx_objects_data = tmx_objects_data
         self.spawn_position: Tuple[float, float] = self._extract_spawn_position(player)
         
+        self._initial_state: Optional[dict] = None
+        
     def _extract_spawn_position(self, player: Optional[Any]) -> Tuple[float, float]:
         if self.tmx_objects_data:
             for obj in self.tmx_objects_data:
@@ -83,76 +96,116 @@ class Room:
         return self._check_tiles_in_area(left, right, top, bottom)
 
     def _check_tiles_in_area(self, left: float, right: float, top: float, bottom: float) -> bool:
+        return self._count_tiles_in_area(self.collision_sat, left, right, top, bottom) > 0
+
+    def _count_tiles_in_area(self, table: list, left: float, right: float, top: float, bottom: float) -> int:
+        """Marked tiles touched by a pixel area (edges inclusive), via the summed-area table"""
+        rows = len(table) - 1
+        cols = len(table[0]) - 1
+        
         tile_left = max(0, int(left // self.tile_size[0]))
-        tile_right = min(len(self.collision_matrix[0]) - 1, int(right // self.tile_size[0]))
+        tile_right = min(cols - 1, int(right // self.tile_size[0]))
         tile_top = max(0, int(top // self.tile_size[1]))
-        tile_bottom = min(len(self.collision_matrix) - 1, int(bottom // self.tile_size[1]))
-        
-        for y in range(tile_top, tile_bottom + 1):
-            for x in range(tile_left, tile_right + 1):
-                if (0 <= y < len(self.collision_matrix) and 
-                    0 <= x < len(self.collision_matrix[0]) and
-                    self.collision_matrix[y][x]):
-                    return True
+        tile_bottom = min(rows - 1, int(bottom // self.tile_size[1]))
         
-        return False
+        return summed_area_sum(table, tile_left, tile_top, tile_right, tile_bottom)
+
+    def rect_hits_walls(self, rect: pygame.Rect) -> bool:
+        """Same result as colliderect against every wall rect, in constant time"""
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        return self._count_tiles_in_area(self.collision_sat, rect.left, rect.right - 1,
+                                         rect.top, rect.bottom - 1) > 0
 
     def get_wall_rects(self) -> List[pygame.Rect]:
+        """Wall rectangles with adjacent blocked tiles merged (cached per room)"""
         if self._wall_rects_cache is not None:
             return self._wall_rects_cache
         
-        wall_rects = []
         if not self.collision_matrix:
-            return wall_rects
-        
-        for y, row in enumerate(self.collision_matrix):
-            for x, blocked in enumerate(row):
-                if blocked:
-                    rect = pygame.Rect(
-                        x * self.tile_size[0],
-                        y * self.tile_size[1],
-                        self.tile_size[0],
-                        self.tile_size[1]
-                    )
-                    wall_rects.append(rect)
-        
-        self._wall_rects_cache = wall_rects
-        return wall_rects
+            return []
+        
+        self._wall_rects_cache = merge_grid_rects(self.collision_matrix, self.tile_size[0], self.tile_size[1])
+        return self._wall_rects_cache
+
+    def get_wall_distance(self, position: Tuple[float, float]) -> int:
+        """Tiles até a parede mais próxima a partir da posição (0 = dentro de parede ou fora do mapa)"""
+        if not self.distance_field:
+            return 0
+        
+        tile_x = int(position[0] // self.tile_size[0])
+        tile_y = int(position[1] // self.tile_size[1])
+        if 0 <= tile_y < len(self.distance_field) and 0 <= tile_x < len(self.distance_field[0]):
+            return self.distance_field[tile_y][tile_x]
+        return 0
+
+    def find_nearest_free_position(self, position: Tuple[float, float],
+                                   entity_size: Tuple[int, int]) -> Optional[Tuple[float, float]]:
+        """Centre of the nearest tile (in 8-neighbour steps) where an entity of this size fits.
+        Falls back to the nearest free tile; None only when the room has no free tile"""
+        field = self.distance_field
+        if not field:
+            return None
+        
+        rows, cols = len(field), len(field[0])
+        tile_width, tile_height = self.tile_size
+        
+        # Meia largura além do próprio tile, em tiles, + 1 para o tile não ser parede
+        overhang = max(entity_size[0] - tile_width, entity_size[1] - tile_height, 0) / 2
+        clearance = math.ceil(overhang / min(tile_width, tile_height)) + 1
+        
+        start_x = max(0, min(cols - 1, int(position[0] // tile_width)))
+        start_y = max(0, min(rows - 1, int(position[1] // tile_height)))
+        
+        visited = [bytearray(cols) for _ in range(rows)]
+        visited[start_y][start_x] = 1
+        queue = [(start_x, start_y)]
+        fallback = None
+        head = 0
+        
+        while head < len(queue):
+            x, y = queue[head]
+            head += 1
+            
+            distance = field[y][x]
+            if distance >= clearance:
+                return ((x + 0.5) * tile_width, (y + 0.5) * tile_height)
+            if distance > 0 and fallback is None:
+                fallback = ((x + 0.5) * tile_width, (y + 0.5) * tile_height)
+            
+            for ny in range(max(0, y - 1), min(rows, y + 2)):
+                visited_row = visited[ny]
+                for nx in range(max(0, x - 1), min(cols, x + 2)):
+                    if not visited_row[nx]:
+                        visited_row[nx] = 1
+                        queue.append((nx, ny))
+        
+        return fallback
 
     def invalidate_collision_cache(self) -> None:
         self._wall_rects_cache = None
         self._fire_rects_cache = None
+        self.collision_sat = build_summed_area_table(self.collision_matrix)
+        self.fire_sat = build_summed_area_table(self.fire_matrix)
+        self.distance_field = compute_distance_field(self.collision_matrix)
     
     def get_fire_rects(self) -> List[pygame.Rect]:
-        """Get fire damage zone rectangles for damage checking"""
+        """Get fire damage zone rectangles for damage checking (merged like the walls)"""
         if self._fire_rects_cache is not None:
             return self._fire_rects_cache
             
-        fire_rects = []
         if not self.fire_matrix:
-            return fire_rects
-            
-        for y, row in enumerate(self.fire_matrix):
-            for x, is_fire in enumerate(row):
-                if is_fire:
-                    fire_rect = pygame.Rect(
-                        x * self.tile_size[0],
-                        y * self.tile_size[1],
-                        self.tile_size[0],
-                        self.tile_size[1]
-                    )
-                    fire_rects.append(fire_rect)
-        
-        self._fire_rects_cache = fire_rects
-        return fire_rects
+            return []
+        
+        self._fire_rects_cache = merge_grid_rects(self.fire_matrix, self.tile_size[0], self.tile_size[1])
+        return self._fire_rects_cache
     
     def check_fire_damage(self, entity_rect: pygame.Rect) -> bool:
         """Check if entity is touching fire zones - returns True if taking damage"""
-        fire_rects = self.get_fire_rects()
-        for fire_rect in fire_rects:
-            if entity_rect.colliderect(fire_rect):
-                return True
-        return False
+        if entity_rect.width <= 0 or entity_rect.height <= 0:
+            return False
+        return self._count_tiles_in_area(self.fire_sat, entity_rect.left, entity_rect.right - 1,
+                                         entity_rect.top, entity_rect.bottom - 1) > 0
     
     def update_tile_animations(self, delta_time: float) -> None:
         """Update animated tile frames based on elapsed time"""
@@ -200,69 +253,131 @@ class Room:
         """Check if background needs updating due to animated tiles"""
         return len(self.animated_tiles) > 0
     
-    def update_background(self) -> None:
-        """Update background with current animated tile frames"""
-        if self.animated_tiles and self.tmx_loader:
-            # Create mapping of original GID to current GID
-            current_tile_mapping = {}
-            for original_gid in self.animated_tiles:
-                current_tile_mapping[original_gid] = self.get_current_tile_gid(original_gid)
-            
-            # Recreate background with animated frames
-            self.background = self.tmx_loader.create_animated_background(current_tile_mapping)
+    def update_background(self, changed_gids: Optional[Iterable[int]] = None) -> Set[Tuple[int, int]]:
+        """Re-blit only the cells holding animated tiles whose frame changed (all animated tiles if None).
+        Returns the redrawn cells"""
+        if not self.animated_tiles or not self.tmx_loader:
+            return set()
+        
+        if self.background is None:
+            return set()
+        
+        # Create mapping of original GID to current GID
+        current_tile_mapping = {}
+        for original_gid in self.animated_tiles:
+            current_tile_mapping[original_gid] = self.get_current_tile_gid(original_gid)
+        
+        animated_cells = self.tmx_loader.get_animated_cells()
+        if changed_gids is None:
+            changed_gids = animated_cells.keys()
+        
+        dirty_cells = set()
+        for gid in changed_gids:
+            dirty_cells.update(animated_cells.get(gid, ()))
+        
+        if dirty_cells:
+            self.background.redraw_cells(self.tmx_loader, dirty_cells, current_tile_mapping)
+        return dirty_cells
 
     # ==========================================
     # BULLET COLLISION 
     # ==========================================
     
-    def handle_bullet_collisions(self, bullets: List[Bullet], on_enemy_death_callback=None) -> None:
-        if not bullets or not self.enemies:
+    def handle_bullet_collisions(self, bullet_system: BulletSystem, collision_optimizer: CollisionOptimizer,
+                                 on_enemy_death_callback=None) -> None:
+        """Resolve every player bullet vs enemy overlap this frame, using the grid as broad phase"""
+        if not len(bullet_system) or not self.enemies:
             return
         
-        for bullet in bullets[:]:
-            if self._process_bullet_collision(bullet, bullets, on_enemy_death_callback):
-                break  
-
-    def _process_bullet_collision(self, bullet: Bullet, bullets: List[Bullet], on_enemy_death_callback=None) -> bool:
-        bullet_rect = pygame.Rect(bullet.position.x, bullet.position.y, 8, 8)
+        xs, ys, sizes = bullet_system.x, bullet_system.y, bullet_system.size
+        owners, penetrations, hit_ids = bullet_system.owner, bullet_system.penetration, bullet_system.hit_ids
+        bullet_rect = pygame.Rect(0, 0, 0, 0)
         
-        for enemy in self.enemies[:]:
-            if not enemy.is_alive():
+        # De trás para frente por causa do swap-remove
+        for index in range(len(xs) - 1, -1, -1):
+            if owners[index] != BulletSystem.OWNER_PLAYER:
+                continue
+            
+            size = sizes[index]
+            bullet_rect.update(xs[index], ys[index], size, size)
+            
+            # O grid só filtra; os acertos seguem a ordem de self.enemies (o conjunto do grid não tem ordem fixa)
+            candidates = {id(candidate.obj) for candidate in
+                          collision_optimizer.get_nearby_dynamic_objects(bullet_rect, "enemy")}
+            if not candidates:
                 continue
-                
-            enemy_rect = pygame.Rect(
-                enemy.position[0], 
-                enemy.position[1], 
-                enemy.size[0], 
-                enemy.size[1]
-            )
             
-            if bullet_rect.colliderect(enemy_rect):
-                enemy.take_damage(bullet.damage)
+            for enemy in self.enemies:
+                if id(enemy) not in candidates:
+                    continue
+                if not enemy.is_alive() or not bullet_rect.colliderect(enemy.hitbox):
+                    continue
                 
-                if bullet in bullets:
-                    bullets.remove(bullet)
+                if penetrations[index]:
+                    # Projétil perfurante atinge cada inimigo só uma vez
+                    already_hit = hit_ids[index]
+                    if id(enemy) in already_hit:
+                        continue
+                    already_hit.add(id(enemy))
                 
-                if not enemy.is_alive():
-                    if hasattr(enemy.position, 'x') and hasattr(enemy.position, 'y'):
-                        enemy_position = (enemy.position.x, enemy.position.y)
-                    else:
-                        enemy_position = enemy.position
-                        
-                    enemy.set_dead_state()
-                    print(f"Inimigo {enemy.id} eliminado!")
-                    
-                    if on_enemy_death_callback:
-                        on_enemy_death_callback(enemy_position)
+                self._apply_bullet_hit(enemy, bullet_system.damage[index], on_enemy_death_callback)
                 
-                return True
+                if not penetrations[index]:
+                    bullet_system.remove(index)
+                    break
+
+    def _apply_bullet_hit(self, enemy, damage: int, on_enemy_death_callback=None) -> None:
+        enemy.take_damage(damage)
         
-        return False 
+        if not enemy.is_alive():
+            if hasattr(enemy.position, 'x') and hasattr(enemy.position, 'y'):
+                enemy_position = (enemy.position.x, enemy.position.y)
+            else:
+                enemy_position = enemy.position
+                
+            enemy.set_dead_state()
+            print(f"Inimigo {enemy.id} eliminado!")
+            
+            if on_enemy_death_callback:
+                on_enemy_death_callback(enemy_position)
 
     # ==========================================
     # ROOM STATE 
     # ==========================================
     
+    def save_initial_state(self) -> None:
+        """Snapshot of the mutable room state (entities, flags, animation) used by restart"""
+        self._initial_state = {
+            "enemies": [(enemy, enemy.snapshot_state()) for enemy in self.enemies],
+            "items": [(item, item.snapshot_state()) for item in self.items],
+            "doors": [(door, door.snapshot_state()) for door in self.doors],
+            "cleared": self.cleared,
+            "visited": self.visited,
+            "animation_time": self.animation_time,
+            "current_tile_frames": dict(self.current_tile_frames)
+        }
+
+    def restore_initial_state(self) -> None:
+        """Volta a sala ao estado do primeiro carregamento, reaproveitando background e matrizes"""
+        state = self._initial_state
+        if state is None:
+            return
+        
+        for key in ("enemies", "items", "doors"):
+            objects = []
+            for obj, snapshot in state[key]:
+                obj.restore_state(snapshot)
+                objects.append(obj)
+            setattr(self, key, objects)
+        
+        self.cleared = state["cleared"]
+        self.visited = state["visited"]
+        self.animation_time = state["animation_time"]
+        self.current_tile_frames = dict(state["current_tile_frames"])
+        
+        # Tiles animados podem estar em outro frame no background
+        self.update_background()
+
     def mark_cleared(self) -> None:
         if not self.cleared:
             self.cleared = True
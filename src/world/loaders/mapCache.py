@@ -0,0 +1,164 @@
+"""
+Map Cache for Linha Direta: The Game
+Compiled on-disk cache of parsed TMX/TSX data (layers, matrices, objects and
+animation tables), keyed by a hash of the TMX and its TSX dependencies
+"""
+
+import os
+import sys
+import pickle
+import hashlib
+import argparse
+from typing import Any, Dict, List, Optional, Sequence
+from src.core.constants import Assets, Cache
+
+
+class MapCache:
+    """Lê/grava o resultado do parse dos mapas para evitar o XML em starts quentes"""
+
+    def __init__(self, cache_dir: str = Cache.MAP_CACHE_DIR,
+                 format_version: int = Cache.MAP_CACHE_FORMAT_VERSION) -> None:
+        self.cache_dir = cache_dir
+        self.format_version = format_version
+
+        # Performance counters
+        self.hits = 0
+        self.misses = 0
+
+    def get_cache_path(self, tmx_path: str) -> str:
+        name = os.path.splitext(os.path.basename(tmx_path))[0]
+        path_hash = hashlib.sha1(os.path.abspath(tmx_path).encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self.cache_dir, f"{name}-{path_hash}.pickle")
+
+    def compute_key(self, tmx_path: str, dependencies: Sequence[str]) -> Optional[str]:
+        """Hash do conteúdo do TMX + TSX (None se algum arquivo sumiu)"""
+        digest = hashlib.sha256(f"v{self.format_version}".encode("utf-8"))
+
+        for path in [tmx_path, *dependencies]:
+            try:
+                with open(path, "rb") as file:
+                    digest.update(path.encode("utf-8"))
+                    digest.update(file.read())
+            except OSError:
+                return None
+
+        return digest.hexdigest()
+
+    def load(self, tmx_path: str) -> Optional[Dict[str, Any]]:
+        cache_path = self.get_cache_path(tmx_path)
+        if not os.path.exists(cache_path):
+            self.misses += 1
+            return None
+
+        try:
+            with open(cache_path, "rb") as file:
+                compiled = pickle.load(file)
+        except Exception as e:
+            print(f"Cache de mapa inválido {cache_path}: {e}")
+            self.misses += 1
+            return None
+
+        # O TMX não mudou => a lista de TSX gravada continua valendo
+        if (compiled.get("version") != self.format_version or
+                compiled.get("key") != self.compute_key(tmx_path, compiled.get("tsx_dependencies", []))):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return compiled
+
+    def store(self, loader) -> bool:
+        """Grava o resultado parseado de um TiledLoader (sem surfaces).
+        Nunca é fatal - se falhar, o loader segue com o que acabou de parsear"""
+        key = self.compute_key(loader.path, loader.tsx_dependencies)
+        if key is None:
+            return False
+
+        compiled = {
+            "version": self.format_version,
+            "key": key,
+            "tsx_dependencies": list(loader.tsx_dependencies),
+            "width": loader.width,
+            "height": loader.height,
+            "tilewidth": loader.tilewidth,
+            "tileheight": loader.tileheight,
+            "tilesets": [{**tileset, "image": None} for tileset in loader.tilesets],
+            "layers": loader.layers,
+            "objects": loader.objects,
+            "collision_matrix": loader.get_collision_matrix(),
+            "fire_matrix": loader.get_fire_matrix(),
+            "animated_cells": loader.get_animated_cells()
+        }
+
+        cache_path = self.get_cache_path(loader.path)
+        temp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, "wb") as file:
+                pickle.dump(compiled, file, protocol=pickle.HIGHEST_PROTOCOL)
+            # Troca atômica - outro processo nunca lê um arquivo pela metade
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            # OSError, mas também PicklingError/TypeError/AttributeError de um valor não serializável
+            print(f"Erro ao gravar cache de mapa {cache_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+        return True
+
+    def invalidate(self, tmx_path: str) -> None:
+        cache_path = self.get_cache_path(tmx_path)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+_map_cache_instance: Optional[MapCache] = None
+
+def get_map_cache() -> MapCache:
+    global _map_cache_instance
+    if _map_cache_instance is None:
+        _map_cache_instance = MapCache()
+    return _map_cache_instance
+
+def prebake_maps(maps_folder: str = Assets.MAPS_FOLDER, force: bool = False) -> List[str]:
+    """Compila todos os .tmx da pasta; retorna os mapas (re)gravados"""
+    from src.world.loaders.tiledLoader import TiledLoader
+
+    cache = get_map_cache()
+    baked = []
+
+    for filename in sorted(os.listdir(maps_folder)):
+        if not filename.endswith(".tmx"):
+            continue
+
+        tmx_path = os.path.join(maps_folder, filename)
+        if force:
+            cache.invalidate(tmx_path)
+
+        loader = TiledLoader(tmx_path, load_images=False)
+        if loader.loaded_from_cache:
+            print(f"Cache em dia: {filename}")
+        elif loader.is_valid():
+            print(f"Mapa compilado: {filename}")
+            baked.append(filename)
+        else:
+            print(f"Falha ao compilar: {filename}")
+
+    return baked
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pré-compila os mapas TMX para o cache em disco")
+    parser.add_argument("folder", nargs="?", default=Assets.MAPS_FOLDER)
+    parser.add_argument("--force", action="store_true", help="recompila mesmo se o cache estiver em dia")
+    args = parser.parse_args(argv)
+
+    prebake_maps(args.folder, force=args.force)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
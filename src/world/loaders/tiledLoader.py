@@ -1,13 +1,24 @@
 import os
 import xml.etree.ElementTree as ET
 import pygame
+from array import array
 from typing import Dict, List, Tuple, Optional, Any
 from PIL import Image, ImageSequence
 from src.world.loaders.assetLoader import AssetLoader, get_asset_loader
+from src.world.loaders.mapCache import get_map_cache
 
 class TiledLoader:
     
-    def __init__(self, tmx_path: str):
+    BACKGROUND_COLOR = (40, 40, 40)
+    
+    # Tipo do array usado nas linhas das camadas (GIDs de 32 bits, incluindo flags de flip).
+    # "I" só garante 2 bytes - cai para "L" onde o unsigned int for menor que 32 bits
+    GID_TYPECODE = "I" if array("I").itemsize >= 4 else "L"
+    
+    COLLISION_LAYER_NAMES = ("colisão", "colisao", "collision")
+    FIRE_LAYER_NAMES = ("fogo", "fire", "damage")
+    
+    def __init__(self, tmx_path: str, use_cache: bool = True, load_images: bool = True):
         self.path = tmx_path
         self.asset_loader = get_asset_loader() 
         
@@ -21,10 +32,42 @@ class TiledLoader:
         
         self.tilesets = []     
         self.tile_images = {}  
+        self.tsx_dependencies: List[str] = []  # TSX lidos no parse (entram na chave do cache)
         
-        self._load_tmx()
+        self._animated_cells: Optional[Dict[int, List[Tuple[int, int]]]] = None
+        self._collision_matrix: Optional[List[List[bool]]] = None
+        self._fire_matrix: Optional[List[List[bool]]] = None
+        self.loaded_from_cache = False
         
-        self._load_tilesets()
+        compiled = get_map_cache().load(tmx_path) if use_cache else None
+        if compiled is not None:
+            self._apply_compiled(compiled)
+        else:
+            self._load_tmx()
+            self._parse_tsx_files()
+            if use_cache and self.is_valid():
+                get_map_cache().store(self)
+        
+        if load_images:
+            self.load_images()
+
+    def is_valid(self) -> bool:
+        return self.width > 0 and self.height > 0 and bool(self.layers)
+
+    def _apply_compiled(self, compiled: Dict[str, Any]) -> None:
+        """Restaura o resultado já parseado vindo do cache compilado (sem XML)"""
+        self.width = compiled["width"]
+        self.height = compiled["height"]
+        self.tilewidth = compiled["tilewidth"]
+        self.tileheight = compiled["tileheight"]
+        self.tilesets = compiled["tilesets"]
+        self.tsx_dependencies = compiled["tsx_dependencies"]
+        self.layers = compiled["layers"]
+        self.objects = compiled["objects"]
+        self._collision_matrix = compiled["collision_matrix"]
+        self._fire_matrix = compiled["fire_matrix"]
+        self._animated_cells = compiled["animated_cells"]
+        self.loaded_from_cache = True
 
     def _load_tmx(self) -> None:
         try:
@@ -103,20 +146,20 @@ class TiledLoader:
             
             for row in rows:
                 if row.strip():
-                    tile_row = []
+                    tile_row = array(self.GID_TYPECODE)
                     for tile_id in row.split(","):
                         if tile_id.strip():
                             tile_row.append(int(tile_id.strip()))
                     if tile_row: 
                         layer_data["data"].append(tile_row)
         else:
-            tile_row = []
+            tile_row = array(self.GID_TYPECODE)
             for tile in data_element.findall("tile"):
                 gid = int(tile.get("gid", 0))
                 tile_row.append(gid)
                 if len(tile_row) == layer_data["width"]:
                     layer_data["data"].append(tile_row)
-                    tile_row = []
+                    tile_row = array(self.GID_TYPECODE)
 
     def _parse_objects(self, root) -> None:
         for obj_group in root.findall("objectgroup"):
@@ -142,13 +185,26 @@ class TiledLoader:
                 
                 self.objects.append(obj_data)
 
-    def _load_tilesets(self) -> None:
+    def _parse_tsx_files(self) -> None:
         try:
             for tileset in self.tilesets:
                 if tileset.get("source"):
                     tsx_path = os.path.join(os.path.dirname(self.path), tileset["source"])
                     self._load_tsx(tileset, tsx_path)
-                
+        
+        except Exception as e:
+            print(f"Erro ao carregar tilesets: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def load_images(self) -> None:
+        """Carrega e fatia as imagens dos tilesets (Surfaces - só na thread principal)"""
+        if not self.tile_images:
+            self._load_tileset_images()
+
+    def _load_tileset_images(self) -> None:
+        try:
+            for tileset in self.tilesets:
                 if tileset.get("image_source"):
                     image_path = tileset["image_source"]
                     name = os.path.splitext(os.path.basename(image_path))[0]
@@ -182,26 +238,34 @@ class TiledLoader:
         
         return fallback
 
+    @staticmethod
+    def resolve_tsx_path(tmx_path: str, tsx_path: str) -> Optional[str]:
+        """Caminho real de um TSX referenciado pelo TMX (None se não existir)"""
+        tsx_path = os.path.normpath(tsx_path)
+        
+        if os.path.exists(tsx_path):
+            return tsx_path
+        
+        if "Assets.tsx" in tsx_path:
+            alternative_paths = [
+                os.path.join(os.path.dirname(tmx_path), "Assets.tsx"),
+                "assets/sprites/world/tilesets/Assets.tsx",
+                "assets/sprites/world/Assets.tsx"
+            ]
+            
+            for alt_path in alternative_paths:
+                if os.path.exists(alt_path):
+                    return alt_path
+        
+        return None
+
     def _load_tsx(self, tileset: Dict, tsx_path: str) -> None:
         try:
-            tsx_path = os.path.normpath(tsx_path)
+            tsx_path = self.resolve_tsx_path(self.path, tsx_path)
+            if tsx_path is None:
+                return
             
-            if not os.path.exists(tsx_path):
-                if "Assets.tsx" in tsx_path:
-                    alternative_paths = [
-                        os.path.join(os.path.dirname(self.path), "Assets.tsx"),
-                        "assets/sprites/world/tilesets/Assets.tsx",
-                        "assets/sprites/world/Assets.tsx"
-                    ]
-                    
-                    for alt_path in alternative_paths:
-                        if os.path.exists(alt_path):
-                            tsx_path = alt_path
-                            break
-                    else:
-                        return
-                else:
-                    return
+            self.tsx_dependencies.append(tsx_path)
             
             tree = ET.parse(tsx_path)
             root = tree.getroot()
@@ -298,7 +362,7 @@ class TiledLoader:
     def create_background(self) -> pygame.Surface:
         width, height = self.get_map_size_pixels()
         background = pygame.Surface((width, height), pygame.SRCALPHA)
-        background.fill((40, 40, 40))
+        background.fill(self.BACKGROUND_COLOR)
         
         for layer in self.layers:
             if not layer["visible"]:
@@ -346,34 +410,30 @@ class TiledLoader:
         else:
             return (200, 200, 200) 
     
-    def get_collision_matrix(self) -> List[List[bool]]:
-        collision_matrix = [[False for _ in range(self.width)] for _ in range(self.height)]
+    def _build_layer_matrix(self, layer_names: Tuple[str, ...]) -> List[List[bool]]:
+        matrix = [[False for _ in range(self.width)] for _ in range(self.height)]
         
         for layer in self.layers:
-            if layer["name"].lower() in ["colisão", "colisao", "collision"]:
+            if layer["name"].lower() in layer_names:
                 
                 for y, row in enumerate(layer["data"]):
                     for x, gid in enumerate(row):
                         if gid > 0:
-                            collision_matrix[y][x] = True
+                            matrix[y][x] = True
                 break
         
-        return collision_matrix
+        return matrix
+    
+    def get_collision_matrix(self) -> List[List[bool]]:
+        if self._collision_matrix is None:
+            self._collision_matrix = self._build_layer_matrix(self.COLLISION_LAYER_NAMES)
+        return [row[:] for row in self._collision_matrix]
     
     def get_fire_matrix(self) -> List[List[bool]]:
         """Get fire damage zones matrix - damages player but doesn't block movement"""
-        fire_matrix = [[False for _ in range(self.width)] for _ in range(self.height)]
-        
-        for layer in self.layers:
-            if layer["name"].lower() in ["fogo", "fire", "damage"]:
-                
-                for y, row in enumerate(layer["data"]):
-                    for x, gid in enumerate(row):
-                        if gid > 0:
-                            fire_matrix[y][x] = True
-                break
-        
-        return fire_matrix
+        if self._fire_matrix is None:
+            self._fire_matrix = self._build_layer_matrix(self.FIRE_LAYER_NAMES)
+        return [row[:] for row in self._fire_matrix]
     
     def get_animated_tiles(self) -> Dict[int, Dict]:
         """Get all animated tile definitions with their frame sequences"""
@@ -403,7 +463,7 @@ class TiledLoader:
         """Create background with animated tiles support - same as original but with animation overrides"""
         width, height = self.get_map_size_pixels()
         background = pygame.Surface((width, height), pygame.SRCALPHA)
-        background.fill((40, 40, 40))
+        background.fill(self.BACKGROUND_COLOR)
         
         room_current_tiles = room_current_tiles or {}
         
@@ -434,6 +494,53 @@ class TiledLoader:
                     pos_y = y * self.tileheight
                     surface.blit(tile_img, (pos_x, pos_y))
     
+    def get_animated_cells(self) -> Dict[int, List[Tuple[int, int]]]:
+        """Index of tile cells (x, y) holding each animated GID, across visible layers"""
+        if self._animated_cells is not None:
+            return self._animated_cells
+        
+        animated_gids = set(self.get_animated_tiles())
+        # dict como conjunto ordenado - a mesma célula pode aparecer em várias camadas
+        cells_by_gid: Dict[int, Dict[Tuple[int, int], None]] = {}
+        
+        if animated_gids:
+            for layer in self.layers:
+                if not layer["visible"]:
+                    continue
+                
+                for y, row in enumerate(layer["data"]):
+                    for x, gid in enumerate(row):
+                        if gid in animated_gids:
+                            cells_by_gid.setdefault(gid, {})[(x, y)] = None
+        
+        animated_cells = {gid: list(cells) for gid, cells in cells_by_gid.items()}
+        self._animated_cells = animated_cells
+        return animated_cells
+    
+    def redraw_cells(self, surface: pygame.Surface, cells: List[Tuple[int, int]], room_current_tiles: dict = None,
+                     origin: Tuple[int, int] = (0, 0)) -> None:
+        """Re-render only the given cells in place, stacking every visible layer.
+        origin = posição no mundo do canto superior esquerdo de surface (ex: um chunk)"""
+        room_current_tiles = room_current_tiles or {}
+        visible_layers = [layer["data"] for layer in self.layers if layer["visible"]]
+        
+        for x, y in cells:
+            pos_x = x * self.tilewidth - origin[0]
+            pos_y = y * self.tileheight - origin[1]
+            surface.fill(self.BACKGROUND_COLOR, (pos_x, pos_y, self.tilewidth, self.tileheight))
+            
+            for data in visible_layers:
+                if y >= len(data) or x >= len(data[y]):
+                    continue
+                
+                gid = data[y][x]
+                if gid == 0:
+                    continue
+                
+                tile_img = self.tile_images.get(room_current_tiles.get(gid, gid))
+                if tile_img:
+                    surface.blit(tile_img, (pos_x, pos_y))
+    
     def _get_tile_surface(self, gid: int) -> Optional[pygame.Surface]:
         """Get tile surface for given GID"""
         if gid <= 0:
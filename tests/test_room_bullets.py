@@ -0,0 +1,79 @@
+"""
+Bullet vs enemy resolution in Room.handle_bullet_collisions
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from src.core.bulletSystem import BulletSystem
+from src.core.collisionOptimizer import CollisionOptimizer
+from src.core.entityFactory import EntityFactory
+from src.world.core.room import Room
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def game_env(monkeypatch):
+    # Configs e sprites são lidos por caminhos relativos à raiz do projeto
+    monkeypatch.chdir(ROOT)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def _make_room(enemies):
+    return Room(id="test", size=(960, 960), objects=[], enemies=enemies, items=[], doors=[],
+                player=None, cleared=False, visited=False, background=None)
+
+
+def _register(optimizer, enemies):
+    for enemy in enemies:
+        optimizer.add_dynamic_object(f"enemy_{id(enemy)}", enemy, enemy.hitbox, kind="enemy")
+
+
+def test_overlapping_enemies_first_in_room_order_takes_the_hit():
+    factory = EntityFactory()
+    first = factory.create_enemy("BasicEnemy", (400, 400))
+    second = factory.create_enemy("BasicEnemy", (405, 400))
+    health = first.health
+    room = _make_room([first, second])
+
+    optimizer = CollisionOptimizer(960, 960)
+    # Registra ao contrário da ordem da sala - a ordem do grid não pode decidir o acerto
+    _register(optimizer, [second, first])
+
+    bullets = BulletSystem()
+    bullets.spawn(400, 398, 0, 0, damage=10, owner=BulletSystem.OWNER_PLAYER, size=6)
+    assert first.hitbox.colliderect(pygame.Rect(400, 398, 6, 6))
+    assert second.hitbox.colliderect(pygame.Rect(400, 398, 6, 6))
+
+    room.handle_bullet_collisions(bullets, optimizer)
+
+    assert first.health == health - 10
+    assert second.health == health
+    assert len(bullets) == 0
+
+
+def test_penetrating_bullet_hits_every_overlapping_enemy_once():
+    factory = EntityFactory()
+    enemies = [factory.create_enemy("BasicEnemy", (400, 400)), factory.create_enemy("BasicEnemy", (405, 400))]
+    health = enemies[0].health
+    room = _make_room(enemies)
+
+    optimizer = CollisionOptimizer(960, 960)
+    _register(optimizer, enemies)
+
+    bullets = BulletSystem()
+    bullets.spawn(400, 398, 0, 0, damage=10, owner=BulletSystem.OWNER_PLAYER, size=6, penetration=True)
+    room.handle_bullet_collisions(bullets, optimizer)
+    room.handle_bullet_collisions(bullets, optimizer)
+
+    assert [enemy.health for enemy in enemies] == [health - 10, health - 10]
+    assert len(bullets) == 1